@@ -1,20 +1,374 @@
 from datetime import datetime, date
 import sqlite3
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 from ..models.schedule import SchedulePeriod, ShiftAssignment, ScheduleStatus, ShiftType
 from ..models.rules import SchedulingRule, RuleType
+from ..models.availability import (
+    TimeOffRequest, TimeOffRequestStatus, TimeOffRequestType
+)
+from functools import lru_cache
+from types import MappingProxyType
 import json
 
+
+@lru_cache(maxsize=256)
+def _parse_rule_params(parameters_json: str) -> MappingProxyType:
+    """Parse a rule's JSON parameters once and cache the result.
+
+    Rules are re-fetched inside the scheduler's hot path, so the same
+    parameter strings are decoded over and over. The cache keys on the
+    raw TEXT column value, and the returned mapping is read-only so the
+    cached dict cannot be mutated by one caller and leak to the next.
+    """
+    return MappingProxyType(json.loads(parameters_json))
+
 class ShiftPreference(Enum):
     GRAVES = "graves"
     SWINGS = "swings"
     DAYS = "days"
     NO_PREFERENCE = "no_preference"
 
+# Compact integer codes used to store shift preferences on disk.
+# A 1-byte integer is smaller and faster to compare than the TEXT value.
+SHIFT_PREFERENCE_CODES = {
+    ShiftPreference.GRAVES: 0,
+    ShiftPreference.SWINGS: 1,
+    ShiftPreference.DAYS: 2,
+    ShiftPreference.NO_PREFERENCE: 3,
+}
+SHIFT_PREFERENCE_BY_CODE = {
+    code: preference for preference, code in SHIFT_PREFERENCE_CODES.items()
+}
+
+# Direct value-to-member maps: a plain dict lookup skips EnumMeta.__call__,
+# which matters when decoding one enum per fetched row.
+_SCHEDULE_STATUS_MAP = ScheduleStatus._value2member_map_
+_TIME_OFF_STATUS_MAP = TimeOffRequestStatus._value2member_map_
+_TIME_OFF_TYPE_MAP = TimeOffRequestType._value2member_map_
+
+# Integer codes for shift types on disk, mirroring the shift-preference
+# encoding: a 1-byte integer instead of a 6-byte collated string.
+SHIFT_TYPE_CODES = {
+    ShiftType.GRAVES: 0,
+    ShiftType.SWINGS: 1,
+    ShiftType.DAYS: 2,
+}
+SHIFT_TYPE_BY_CODE = {code: shift for shift, code in SHIFT_TYPE_CODES.items()}
+
+# Converters run while sqlite3 materializes each row, so the fetch loops
+# never see the raw storage format and never call a parser per field.
+sqlite3.register_converter('EPOCH', lambda v: datetime.fromtimestamp(int(v)))
+sqlite3.register_converter('TIMESTAMP', lambda v: datetime.fromisoformat(v.decode()))
+sqlite3.register_converter('DAY', lambda v: date.fromordinal(int(v)))
+
+# Matching adapters let methods bind date/datetime objects directly and
+# keep the storage encoding (ordinal days, epoch seconds) in one place.
+sqlite3.register_adapter(date, date.toordinal)
+sqlite3.register_adapter(datetime, lambda dt: int(dt.timestamp()))
+
+def pack_days_off(days: List[int]) -> int:
+    """Pack weekday numbers (0 = Monday) into a 7-bit mask for storage."""
+    mask = 0
+    for day in days:
+        mask |= 1 << day
+    return mask
+
+def unpack_days_off(mask: int) -> List[int]:
+    """Expand a 7-bit days-off mask back into sorted weekday numbers."""
+    return [day for day in range(7) if mask >> day & 1]
+
+
+# SQL statements issued on hot paths, hoisted to module level. Passing
+# the same string object every call lets the connection's statement
+# cache hit on identity instead of re-hashing a freshly built literal.
+_INSERT_EMPLOYEE_SQL = '''
+    INSERT INTO employees (
+        first_name, last_name, email, hire_date,
+        shift_preference, fixed_days_off, is_active
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+'''
+
+_UPDATE_EMPLOYEE_SQL = '''
+    UPDATE employees
+    SET first_name = ?, last_name = ?, email = ?,
+        hire_date = ?, shift_preference = ?,
+        fixed_days_off = ?, is_active = ?
+    WHERE id = ?
+'''
+
+_SELECT_EMPLOYEE_SQL = '''
+    SELECT id, first_name, last_name, email, hire_date,
+           shift_preference, fixed_days_off, is_active
+    FROM employees
+    WHERE id = ?
+'''
+
+_SELECT_EMPLOYEES_SQL = '''
+    SELECT id, first_name, last_name, email, hire_date,
+           shift_preference, fixed_days_off, is_active
+    FROM employees
+    ORDER BY id
+'''
+
+_SELECT_ACTIVE_EMPLOYEES_SQL = '''
+    SELECT id, first_name, last_name, email, hire_date,
+           shift_preference, fixed_days_off, is_active
+    FROM employees
+    WHERE is_active = 1
+    ORDER BY id
+'''
+
+# Formatted with one ? per requested id; sqlite caches a prepared
+# statement per distinct placeholder count, so repeated same-sized
+# batches still hit the statement cache.
+_SELECT_EMPLOYEES_BY_IDS_SQL = '''
+    SELECT id, first_name, last_name, email, hire_date,
+           shift_preference, fixed_days_off, is_active
+    FROM employees
+    WHERE id IN ({placeholders})
+'''
+
+_INSERT_SCHEDULE_PERIOD_SQL = '''
+    INSERT INTO schedule_periods (
+        start_date, end_date, status, created_at, updated_at
+    ) VALUES (:start_date, :end_date, :status, :created_at, :updated_at)
+'''
+
+_INSERT_SHIFT_SQL = '''
+    INSERT INTO shift_assignments (
+        schedule_id, employee_id, shift_date,
+        shift_type, notes
+    ) VALUES (:schedule_id, :employee_id, :shift_date, :shift_type, :notes)
+'''
+
+_SELECT_SCHEDULE_PERIOD_SQL = '''
+    SELECT start_date, end_date, status, created_at, updated_at
+    FROM schedule_periods
+    WHERE id = ?
+'''
+
+_SELECT_SHIFTS_SQL = '''
+    SELECT id, employee_id, shift_date, shift_type, notes
+    FROM shift_assignments
+    WHERE schedule_id = ?
+    ORDER BY shift_date, shift_type
+'''
+
+_SELECT_EMPLOYEE_SHIFTS_SQL = '''
+    SELECT sa.id, sa.shift_date, sa.shift_type,
+        sa.schedule_id, sa.notes
+    FROM shift_assignments sa
+    JOIN schedule_periods sp ON sa.schedule_id = sp.id
+    WHERE sa.employee_id = ?
+    AND sa.shift_date BETWEEN ? AND ?
+    AND sp.status != 'draft'
+    ORDER BY sa.shift_date, sa.shift_type
+'''
+
+_DELETE_SHIFT_SLOT_SQL = '''
+    DELETE FROM shift_assignments
+    WHERE schedule_id = ?
+    AND shift_date = ?
+    AND shift_type = ?
+'''
+
+_SELECT_SHIFT_EMPLOYEE_IDS_SQL = '''
+    SELECT employee_id
+    FROM shift_assignments
+    WHERE schedule_id = ?
+    AND shift_date = ?
+    AND shift_type = ?
+'''
+
+# Everything the week grid needs in one round trip: matching period
+# rows (kind 0), their shift rows (kind 1) and the employees those
+# shifts reference (kind 2). The branches share one ten-column list;
+# payload columns are wrapped in expressions so declared-type
+# converters don't misfire across branches, and the date fields are
+# decoded by hand instead.
+_SELECT_WEEK_VIEW_SQL = '''
+    WITH matched AS (
+        SELECT id, start_date, end_date, status, created_at, updated_at
+        FROM schedule_periods
+        WHERE start_date >= ? AND end_date <= ?
+    ),
+    week_shifts AS (
+        SELECT sa.id, sa.schedule_id, sa.employee_id,
+               sa.shift_date, sa.shift_type, sa.notes
+        FROM shift_assignments sa
+        JOIN matched m ON sa.schedule_id = m.id
+    )
+    SELECT 0 AS kind, id, start_date + 0, end_date + 0, status,
+           created_at || '', updated_at || '', NULL, NULL, NULL
+    FROM matched
+    UNION ALL
+    SELECT 1, id, schedule_id, employee_id, shift_date + 0,
+           shift_type, notes, NULL, NULL, NULL
+    FROM week_shifts
+    UNION ALL
+    SELECT 2, e.id, e.first_name, e.last_name, e.email,
+           e.hire_date + 0, e.shift_preference, e.fixed_days_off,
+           e.is_active, NULL
+    FROM employees e
+    WHERE e.id IN (SELECT DISTINCT employee_id FROM week_shifts)
+    ORDER BY kind, 3 DESC
+'''
+
+_SELECT_ACTIVE_RULES_SQL = '''
+    SELECT id, rule_type, priority, parameters,
+        description, is_active
+    FROM scheduling_rules
+    WHERE is_active = 1
+    ORDER BY priority DESC
+'''
+
+# Complete schema, applied in one executescript transaction.
+_SCHEMA_SQL = """
+BEGIN;
+
+    CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        hire_date EPOCH NOT NULL,  -- unix epoch seconds
+        shift_preference INTEGER NOT NULL,  -- SHIFT_PREFERENCE_CODES
+        fixed_days_off INTEGER NOT NULL DEFAULT 0,  -- 7-bit mask, bit 0 = Monday
+        is_active INTEGER NOT NULL DEFAULT 1,  -- 0 or 1
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS schedule_periods (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        start_date DAY NOT NULL,  -- date.toordinal() days
+        end_date DAY NOT NULL,      -- date.toordinal() days
+        status TEXT NOT NULL,  -- draft, published, archived
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        created_by INTEGER,
+        FOREIGN KEY (created_by) REFERENCES employees (id),
+        CHECK (start_date <= end_date),
+        CHECK (status IN ('draft', 'published', 'archived'))
+    );
+
+    CREATE TABLE IF NOT EXISTS shift_assignments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        schedule_id INTEGER NOT NULL,
+        employee_id INTEGER NOT NULL,
+        shift_date DAY NOT NULL,  -- date.toordinal() days
+        shift_type INTEGER NOT NULL,  -- SHIFT_TYPE_CODES
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (schedule_id) REFERENCES schedule_periods (id),
+        FOREIGN KEY (employee_id) REFERENCES employees (id),
+        CHECK (shift_type IN (0, 1, 2)),
+        UNIQUE (employee_id, shift_date)  -- No double booking
+    );
+
+    CREATE TABLE IF NOT EXISTS employee_availability (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        employee_id INTEGER NOT NULL,
+        max_shifts_per_week INTEGER DEFAULT 5,
+        min_hours_between_shifts INTEGER DEFAULT 12,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (employee_id) REFERENCES employees (id),
+        CHECK (max_shifts_per_week BETWEEN 1 AND 7),
+        CHECK (min_hours_between_shifts >= 8)
+    );
+
+    -- WITHOUT ROWID: the composite key IS the row, so lookups hit one
+    -- B-tree instead of a key index plus a hidden rowid table.
+    CREATE TABLE IF NOT EXISTS preferred_shifts (
+        employee_id INTEGER,
+        shift_type TEXT NOT NULL,
+        FOREIGN KEY (employee_id) REFERENCES employees (id),
+        PRIMARY KEY (employee_id, shift_type),
+        CHECK (shift_type IN ('graves', 'swings', 'days'))
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS scheduling_rules (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        rule_type TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        parameters TEXT NOT NULL,  -- JSON formatted parameters
+        is_active INTEGER DEFAULT 1,  -- 0 or 1
+        description TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CHECK (priority BETWEEN 1 AND 100)
+    );
+
+    CREATE TABLE IF NOT EXISTS time_off_requests (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        employee_id INTEGER NOT NULL,
+        start_date DAY NOT NULL,  -- date.toordinal() days
+        end_date DAY NOT NULL,      -- date.toordinal() days
+        request_type TEXT NOT NULL,  -- vacation, sick_leave, training, personal
+        status TEXT NOT NULL,      -- pending, approved, denied, cancelled
+        notes TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (employee_id) REFERENCES employees (id),
+        CHECK (start_date <= end_date),
+        CHECK (request_type IN ('vacation', 'sick_leave', 'training', 'personal')),
+        CHECK (status IN ('pending', 'approved', 'denied', 'cancelled'))
+    );
+
+    CREATE TRIGGER IF NOT EXISTS update_employee_timestamp 
+    AFTER UPDATE ON employees
+    BEGIN
+        UPDATE employees 
+        SET updated_at = CURRENT_TIMESTAMP 
+        WHERE id = NEW.id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS update_schedule_timestamp 
+    AFTER UPDATE ON schedule_periods
+    BEGIN
+        UPDATE schedule_periods 
+        SET updated_at = CURRENT_TIMESTAMP 
+        WHERE id = NEW.id;
+    END;
+
+    CREATE INDEX IF NOT EXISTS idx_shift_assignments_date 
+    ON shift_assignments (shift_date);
+
+    -- Covers the per-schedule shift lookups (get_schedule_period and
+    -- the week view), which always filter on schedule_id and order or
+    -- filter by shift_date; the trailing columns also answer the edit
+    -- dialog's staff-for-one-shift query from the index alone.
+    DROP INDEX IF EXISTS idx_shift_assignments_schedule_date;
+    CREATE INDEX IF NOT EXISTS idx_shift_assignments_schedule_date_type
+    ON shift_assignments (schedule_id, shift_date, shift_type, employee_id);
+
+    -- Covering index for get_employee_schedule: filter columns first,
+    -- then the selected columns, so the whole query is answered from
+    -- the index without a rowid lookup per matching shift.
+    CREATE INDEX IF NOT EXISTS idx_shift_assignments_employee_cover
+    ON shift_assignments (employee_id, shift_date, schedule_id, shift_type, notes);
+
+    CREATE INDEX IF NOT EXISTS idx_time_off_dates
+    ON time_off_requests (start_date, end_date);
+
+    CREATE INDEX IF NOT EXISTS idx_employees_active
+    ON employees (id)
+    WHERE is_active = 1;
+
+COMMIT;
+"""
+
 @dataclass
 class Employee:
+    # Rosters create one instance per row; slots drop the per-instance
+    # __dict__ and cut memory roughly in half.
+    __slots__ = ('id', 'first_name', 'last_name', 'email', 'hire_date',
+                 'shift_preference', 'fixed_days_off', 'is_active')
+
     id: Optional[int]
     first_name: str
     last_name: str
@@ -29,189 +383,81 @@ class Employee:
         return f"{self.first_name} {self.last_name}"
 
 class DatabaseManager:
+    # Rows pulled from SQLite per fetchmany batch when streaming results;
+    # batching amortizes the per-call overhead without buffering everything.
+    FETCH_BATCH_SIZE = 256
+
     def __init__(self, db_path: str):
         """Initialize the database manager with the specified database path."""
         self.db_path = db_path
-        
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the shared connection, opening and tuning it on first use."""
+        if self._conn is None:
+            # sqlite3 keeps an LRU cache of prepared statements keyed by the
+            # exact SQL string; size it to hold every statement this class
+            # issues so queries are parsed and planned only once.
+            # check_same_thread=False lets worker threads reuse this one
+            # connection instead of opening their own; WAL plus sqlite3's
+            # own locking keeps that safe for our short statements.
+            conn = sqlite3.connect(
+                self.db_path,
+                cached_statements=256,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                check_same_thread=False
+            )
+
+            # WAL lets readers run concurrently with the writer and turns
+            # most commits into sequential appends; synchronous=NORMAL is
+            # safe in WAL mode and avoids an fsync per transaction.
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            conn.execute('PRAGMA foreign_keys = ON')
+
+            # Keep more pages in memory (negative = KiB), spill sorts and
+            # temp B-trees to RAM, and read the file via mmap instead of
+            # read() syscalls.
+            conn.execute('PRAGMA cache_size = -8192')
+            conn.execute('PRAGMA temp_store = MEMORY')
+            conn.execute('PRAGMA mmap_size = 67108864')
+
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the shared connection if it is open."""
+        if self._conn is not None:
+            # Let SQLite refresh whatever planner statistics have gone
+            # stale during this session; it's a cheap no-op otherwise.
+            self._conn.execute('PRAGMA optimize')
+            self._conn.close()
+            self._conn = None
+
     def initialize_database(self) -> None:
         """Initialize or update the complete database schema."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Enable foreign key support
-            cursor.execute('PRAGMA foreign_keys = ON')
-            
-            # Create or update employees table - already exists but shown for completeness
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS employees (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    hire_date TEXT NOT NULL,
-                    shift_preference TEXT NOT NULL,
-                    is_active BOOLEAN NOT NULL DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create schedule_periods table - manages complete schedules
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS schedule_periods (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
-                    status TEXT NOT NULL,  -- draft, published, archived
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_by INTEGER,
-                    FOREIGN KEY (created_by) REFERENCES employees (id),
-                    CHECK (start_date <= end_date),
-                    CHECK (status IN ('draft', 'published', 'archived'))
-                )
-            ''')
-            
-            # Create shift_assignments table - individual shift assignments
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS shift_assignments (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    schedule_id INTEGER NOT NULL,
-                    employee_id INTEGER NOT NULL,
-                    shift_date TEXT NOT NULL,
-                    shift_type TEXT NOT NULL,  -- graves, swings, days
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (schedule_id) REFERENCES schedule_periods (id),
-                    FOREIGN KEY (employee_id) REFERENCES employees (id),
-                    CHECK (shift_type IN ('graves', 'swings', 'days')),
-                    UNIQUE (employee_id, shift_date)  -- No double booking
-                )
-            ''')
-            
-            # Create employee_availability table - recurring availability patterns
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS employee_availability (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER NOT NULL,
-                    max_shifts_per_week INTEGER DEFAULT 5,
-                    min_hours_between_shifts INTEGER DEFAULT 12,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees (id),
-                    CHECK (max_shifts_per_week BETWEEN 1 AND 7),
-                    CHECK (min_hours_between_shifts >= 8)
-                )
-            ''')
-            
-            # Create preferred_shifts table - many-to-many relationship
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS preferred_shifts (
-                    employee_id INTEGER,
-                    shift_type TEXT NOT NULL,
-                    FOREIGN KEY (employee_id) REFERENCES employees (id),
-                    PRIMARY KEY (employee_id, shift_type),
-                    CHECK (shift_type IN ('graves', 'swings', 'days'))
-                )
-            ''')
-            
-            # Create scheduling_rules table - configurable scheduling constraints
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS scheduling_rules (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    rule_type TEXT NOT NULL,
-                    priority INTEGER NOT NULL,
-                    parameters TEXT NOT NULL,  -- JSON formatted parameters
-                    is_active BOOLEAN DEFAULT TRUE,
-                    description TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    CHECK (priority BETWEEN 1 AND 100)
-                )
-            ''')
-            
-            # Create time_off_requests table - already exists but enhanced
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS time_off_requests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    employee_id INTEGER NOT NULL,
-                    start_date TEXT NOT NULL,
-                    end_date TEXT NOT NULL,
-                    request_type TEXT NOT NULL,  -- vacation, sick_leave, training, personal
-                    status TEXT NOT NULL,      -- pending, approved, denied, cancelled
-                    notes TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (employee_id) REFERENCES employees (id),
-                    CHECK (start_date <= end_date),
-                    CHECK (request_type IN ('vacation', 'sick_leave', 'training', 'personal')),
-                    CHECK (status IN ('pending', 'approved', 'denied', 'cancelled'))
-                )
-            ''')
-            
-            # Create triggers to update timestamps
-            cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_employee_timestamp 
-                AFTER UPDATE ON employees
-                BEGIN
-                    UPDATE employees 
-                    SET updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = NEW.id;
-                END
-            ''')
-            
-            cursor.execute('''
-                CREATE TRIGGER IF NOT EXISTS update_schedule_timestamp 
-                AFTER UPDATE ON schedule_periods
-                BEGIN
-                    UPDATE schedule_periods 
-                    SET updated_at = CURRENT_TIMESTAMP 
-                    WHERE id = NEW.id;
-                END
-            ''')
-            
-            # Add indexes for common queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_shift_assignments_date 
-                ON shift_assignments (shift_date)
-            ''')
-            
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_time_off_dates 
-                ON time_off_requests (start_date, end_date)
-            ''')
-            
-            conn.commit()
+        # One executescript call parses and runs the whole DDL batch
+        # inside a single transaction instead of a statement-by-statement
+        # round trip through execute() followed by a separate commit.
+        self._connect().executescript(_SCHEMA_SQL)
 
     def add_employee(self, employee: Employee) -> int:
         """Add a new employee to the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             try:
-                cursor.execute('''
-                    INSERT INTO employees (
-                        first_name, last_name, email, hire_date,
-                        shift_preference, is_active
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_INSERT_EMPLOYEE_SQL, (
                     employee.first_name,
                     employee.last_name,
                     employee.email,
-                    employee.hire_date.isoformat(),
-                    employee.shift_preference.value,
+                    employee.hire_date,
+                    SHIFT_PREFERENCE_CODES[employee.shift_preference],
+                    pack_days_off(employee.fixed_days_off),
                     employee.is_active
                 ))
-                
-                employee_id = cursor.lastrowid
-                
-                # Add fixed days off
-                for day in employee.fixed_days_off:
-                    cursor.execute('''
-                        INSERT INTO fixed_days_off (employee_id, day_of_week)
-                        VALUES (?, ?)
-                    ''', (employee_id, day))
-                
+
+                employee_id = cursor.fetchone()[0]
                 conn.commit()
                 return employee_id
                 
@@ -219,40 +465,83 @@ class DatabaseManager:
                 conn.rollback()
                 raise ValueError(f"Employee data integrity error: {str(e)}")
 
+    def bulk_add_employees(self, employees: List[Employee]) -> List[int]:
+        """
+        Add multiple employees in a single transaction.
+        Much faster than repeated add_employee calls, which each pay for
+        their own commit. Returns the new employee IDs in input order.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # Take the write lock up front; a deferred transaction could
+        # hit SQLITE_BUSY upgrading to a write lock partway through.
+        cursor.execute('BEGIN IMMEDIATE')
+
+        try:
+            employee_ids = []
+
+            # Insert in multi-row VALUES batches; RETURNING id hands
+            # back every new key without a per-row lastrowid round trip.
+            batch_size = 100
+            for start in range(0, len(employees), batch_size):
+                batch = employees[start:start + batch_size]
+                placeholders = ', '.join(
+                    ['(?, ?, ?, ?, ?, ?, ?)'] * len(batch)
+                )
+                params = []
+                for employee in batch:
+                    params.extend((
+                        employee.first_name,
+                        employee.last_name,
+                        employee.email,
+                        employee.hire_date,
+                        SHIFT_PREFERENCE_CODES[employee.shift_preference],
+                        pack_days_off(employee.fixed_days_off),
+                        employee.is_active
+                    ))
+
+                cursor.execute(f'''
+                    INSERT INTO employees (
+                        first_name, last_name, email, hire_date,
+                        shift_preference, fixed_days_off, is_active
+                    ) VALUES {placeholders}
+                    RETURNING id
+                ''', params)
+
+                employee_ids.extend(row[0] for row in cursor.fetchall())
+
+            conn.commit()
+
+            # A bulk load can shift table shape enough to invalidate
+            # the planner's statistics; refresh them right away.
+            cursor.execute('ANALYZE employees')
+            return employee_ids
+
+        except sqlite3.IntegrityError as e:
+            conn.rollback()
+            raise ValueError(f"Employee data integrity error: {str(e)}")
+
     def update_employee(self, employee: Employee) -> None:
         """Update an existing employee's information."""
         if employee.id is None:
             raise ValueError("Employee ID is required for updates")
             
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             try:
-                cursor.execute('''
-                    UPDATE employees
-                    SET first_name = ?, last_name = ?, email = ?,
-                        hire_date = ?, shift_preference = ?, is_active = ?
-                    WHERE id = ?
-                ''', (
+                cursor.execute(_UPDATE_EMPLOYEE_SQL, (
                     employee.first_name,
                     employee.last_name,
                     employee.email,
-                    employee.hire_date.isoformat(),
-                    employee.shift_preference.value,
+                    employee.hire_date,
+                    SHIFT_PREFERENCE_CODES[employee.shift_preference],
+                    pack_days_off(employee.fixed_days_off),
                     employee.is_active,
                     employee.id
                 ))
-                
-                # Update fixed days off
-                cursor.execute('DELETE FROM fixed_days_off WHERE employee_id = ?',
-                             (employee.id,))
-                
-                for day in employee.fixed_days_off:
-                    cursor.execute('''
-                        INSERT INTO fixed_days_off (employee_id, day_of_week)
-                        VALUES (?, ?)
-                    ''', (employee.id, day))
-                
+
                 conn.commit()
                 
             except sqlite3.IntegrityError as e:
@@ -261,83 +550,105 @@ class DatabaseManager:
 
     def get_employee(self, employee_id: int) -> Optional[Employee]:
         """Retrieve an employee by their ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, first_name, last_name, email, hire_date,
-                       shift_preference, is_active
-                FROM employees
-                WHERE id = ?
-            ''', (employee_id,))
-            
-            employee_data = cursor.fetchone()
-            if not employee_data:
-                return None
-                
-            # Get fixed days off
-            cursor.execute('''
-                SELECT day_of_week
-                FROM fixed_days_off
-                WHERE employee_id = ?
-                ORDER BY day_of_week
-            ''', (employee_id,))
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
             
-            fixed_days_off = [row[0] for row in cursor.fetchall()]
-            
-            return Employee(
-                id=employee_data[0],
-                first_name=employee_data[1],
-                last_name=employee_data[2],
-                email=employee_data[3],
-                hire_date=datetime.fromisoformat(employee_data[4]),
-                shift_preference=ShiftPreference(employee_data[5]),
-                fixed_days_off=fixed_days_off,
-                is_active=bool(employee_data[6])
+        cursor.execute(_SELECT_EMPLOYEE_SQL, (employee_id,))
+
+        employee_data = cursor.fetchone()
+        if not employee_data:
+            return None
+
+        (row_id, first_name, last_name, email, hire_date,
+         preference_code, days_off_mask, is_active) = employee_data
+
+        return Employee(
+            id=row_id,
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            hire_date=hire_date,
+            shift_preference=SHIFT_PREFERENCE_BY_CODE[preference_code],
+            fixed_days_off=unpack_days_off(days_off_mask),
+            is_active=is_active & 1
+        )
+
+    def get_employees_by_ids(self, employee_ids) -> List[Employee]:
+        """
+        Retrieve several employees with one SELECT ... WHERE id IN (...).
+        Callers that need many employees at once (e.g. every assignee in
+        a week's schedule) get one round trip instead of one per id.
+        """
+        ids = list(employee_ids)
+        if not ids:
+            return []
+
+        cursor = self._connect().cursor()
+        cursor.execute(
+            _SELECT_EMPLOYEES_BY_IDS_SQL.format(
+                placeholders=', '.join('?' * len(ids))
+            ),
+            ids
+        )
+
+        return [
+            Employee(
+                id=row_id,
+                first_name=first_name,
+                last_name=last_name,
+                email=email,
+                hire_date=hire_date,
+                shift_preference=SHIFT_PREFERENCE_BY_CODE[preference_code],
+                fixed_days_off=unpack_days_off(days_off_mask),
+                is_active=is_active & 1
             )
+            for (row_id, first_name, last_name, email, hire_date,
+                 preference_code, days_off_mask, is_active)
+            in cursor.fetchall()
+        ]
+
+    def iter_employees(self, active_only: bool = True) -> Iterator[Employee]:
+        """
+        Stream employees one at a time without materializing the full list.
+        Rows are pulled from the cursor as the caller iterates, so memory
+        stays flat no matter how large the roster grows.
+        """
+        cursor = self._connect().cursor()
+
+        query = (_SELECT_ACTIVE_EMPLOYEES_SQL if active_only
+                 else _SELECT_EMPLOYEES_SQL)
+
+        cursor.arraysize = self.FETCH_BATCH_SIZE
+        cursor.execute(query)
+
+        # Bind the per-row helpers to locals; inside the loop this turns
+        # global/attribute lookups into fast local loads.
+        make_employee = Employee
+        preference_by_code = SHIFT_PREFERENCE_BY_CODE
+        unpack_mask = unpack_days_off
+
+        # Pull rows in arraysize-sized batches rather than one at a time.
+        # Unpacking the whole tuple at once avoids eight per-field index
+        # lookups a row.
+        while rows := cursor.fetchmany():
+            for (row_id, first_name, last_name, email, hire_date,
+                 preference_code, days_off_mask, is_active) in rows:
+
+                yield make_employee(
+                    id=row_id,
+                    first_name=first_name,
+                    last_name=last_name,
+                    email=email,
+                    hire_date=hire_date,
+                    shift_preference=preference_by_code[preference_code],
+                    fixed_days_off=unpack_mask(days_off_mask),
+                    is_active=is_active & 1
+                )
 
     def get_all_employees(self, active_only: bool = True) -> List[Employee]:
         """Retrieve all employees, optionally filtering for active only."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            query = '''
-                SELECT id, first_name, last_name, email, hire_date,
-                       shift_preference, is_active
-                FROM employees
-            '''
-            
-            if active_only:
-                query += ' WHERE is_active = 1'
-                
-            cursor.execute(query)
-            employees = []
-            
-            for row in cursor.fetchall():
-                employee_id = row[0]
-                
-                # Get fixed days off for each employee
-                cursor.execute('''
-                    SELECT day_of_week
-                    FROM fixed_days_off
-                    WHERE employee_id = ?
-                    ORDER BY day_of_week
-                ''', (employee_id,))
-                
-                fixed_days_off = [day[0] for day in cursor.fetchall()]
-                
-                employees.append(Employee(
-                    id=employee_id,
-                    first_name=row[1],
-                    last_name=row[2],
-                    email=row[3],
-                    hire_date=datetime.fromisoformat(row[4]),
-                    shift_preference=ShiftPreference(row[5]),
-                    fixed_days_off=fixed_days_off,
-                    is_active=bool(row[6])
-                ))
-                
-            return employees
+        return list(self.iter_employees(active_only=active_only))
         
     def create_schedule_period(self, schedule_period: SchedulePeriod) -> int:
         """
@@ -345,94 +656,93 @@ class DatabaseManager:
         All operations are performed within a single transaction for data consistency.
         Returns the ID of the newly created schedule period.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            try:
-                # Insert the schedule period
-                cursor.execute('''
-                    INSERT INTO schedule_periods (
-                        start_date, end_date, status, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?)
-                ''', (
-                    schedule_period.start_date.isoformat(),
-                    schedule_period.end_date.isoformat(),
-                    schedule_period.status.value,
-                    schedule_period.created_at.isoformat(),
-                    schedule_period.updated_at.isoformat()
-                ))
-                
-                # Get the new schedule period ID
-                schedule_id = cursor.lastrowid
-                
-                # Insert all shift assignments
-                for shift in schedule_period.shifts:
-                    cursor.execute('''
-                        INSERT INTO shift_assignments (
-                            schedule_id, employee_id, shift_date,
-                            shift_type, notes
-                        ) VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        schedule_id,
-                        shift.employee_id,
-                        shift.date.isoformat(),
-                        shift.shift_type.value,
-                        shift.notes
-                    ))
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # Take the write lock up front; a deferred transaction could
+        # hit SQLITE_BUSY upgrading to a write lock partway through.
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            # Insert the schedule period
+            cursor.execute(_INSERT_SCHEDULE_PERIOD_SQL, {
+                'start_date': schedule_period.start_date,
+                'end_date': schedule_period.end_date,
+                'status': schedule_period.status.value,
+                'created_at': schedule_period.created_at.isoformat(),
+                'updated_at': schedule_period.updated_at.isoformat()
+            })
                 
-                conn.commit()
-                return schedule_id
+            # Get the new schedule period ID
+            schedule_id = cursor.lastrowid
+
+            # Insert all shift assignments in one batch
+            cursor.executemany(_INSERT_SHIFT_SQL, [
+                {
+                    'schedule_id': schedule_id,
+                    'employee_id': shift.employee_id,
+                    'shift_date': shift.date,
+                    'shift_type': SHIFT_TYPE_CODES[shift.shift_type],
+                    'notes': shift.notes
+                }
+                for shift in schedule_period.shifts
+            ])
+
+            conn.commit()
+            return schedule_id
                 
-            except sqlite3.Error as e:
-                conn.rollback()
-                raise ValueError(f"Failed to create schedule: {str(e)}")
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise ValueError(f"Failed to create schedule: {str(e)}")
 
     def get_schedule_period(self, schedule_id: int) -> Optional[SchedulePeriod]:
         """
         Retrieve a complete schedule period including all shift assignments.
         Returns None if the schedule period doesn't exist.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
             
-            # Get the schedule period details
-            cursor.execute('''
-                SELECT start_date, end_date, status, created_at, updated_at
-                FROM schedule_periods
-                WHERE id = ?
-            ''', (schedule_id,))
+        # Get the schedule period details
+        cursor.execute(_SELECT_SCHEDULE_PERIOD_SQL, (schedule_id,))
             
-            period_data = cursor.fetchone()
-            if not period_data:
-                return None
+        period_data = cursor.fetchone()
+        if not period_data:
+            return None
                 
-            # Get all shift assignments for this schedule
-            cursor.execute('''
-                SELECT id, employee_id, shift_date, shift_type, notes
-                FROM shift_assignments
-                WHERE schedule_id = ?
-                ORDER BY shift_date, shift_type
-            ''', (schedule_id,))
-            
-            shifts = []
-            for shift_data in cursor.fetchall():
-                shifts.append(ShiftAssignment(
-                    id=shift_data[0],
-                    employee_id=shift_data[1],
-                    date=date.fromisoformat(shift_data[2]),
-                    shift_type=ShiftType(shift_data[3]),
+        shifts = list(self.iter_schedule_shifts(schedule_id))
+
+        return SchedulePeriod._from_row(
+            id=schedule_id,
+            start_date=period_data[0],
+            end_date=period_data[1],
+            status=_SCHEDULE_STATUS_MAP[period_data[2]],
+            created_at=period_data[3],
+            updated_at=period_data[4],
+            shifts=shifts
+        )
+
+    def iter_schedule_shifts(self, schedule_id: int) -> Iterator[ShiftAssignment]:
+        """
+        Stream a schedule's shift assignments ordered by date and type.
+        Rows come off the cursor in batches and are yielded one at a
+        time, so nothing is materialized twice.
+        """
+        cursor = self._connect().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.arraysize = self.FETCH_BATCH_SIZE
+        cursor.execute(_SELECT_SHIFTS_SQL, (schedule_id,))
+
+        while rows := cursor.fetchmany():
+            for row in rows:
+                yield ShiftAssignment._from_row(
+                    id=row['id'],
+                    employee_id=row['employee_id'],
+                    date=row['shift_date'],
+                    shift_type=SHIFT_TYPE_BY_CODE[row['shift_type']],
                     schedule_id=schedule_id,
-                    notes=shift_data[4]
-                ))
-            
-            return SchedulePeriod(
-                id=schedule_id,
-                start_date=date.fromisoformat(period_data[0]),
-                end_date=date.fromisoformat(period_data[1]),
-                status=ScheduleStatus(period_data[2]),
-                created_at=datetime.fromisoformat(period_data[3]),
-                updated_at=datetime.fromisoformat(period_data[4]),
-                shifts=shifts
-            )
+                    notes=row['notes']
+                )
 
     def get_schedule_periods(
         self,
@@ -444,33 +754,129 @@ class DatabaseManager:
         Retrieve all schedule periods matching the given criteria.
         Supports filtering by date range and status.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            query = "SELECT id FROM schedule_periods WHERE 1=1"
-            params = []
-            
-            if start_date:
-                query += " AND start_date >= ?"
-                params.append(start_date.isoformat())
-            
-            if end_date:
-                query += " AND end_date <= ?"
-                params.append(end_date.isoformat())
-            
-            if status:
-                query += " AND status = ?"
-                params.append(status.value)
-                
-            query += " ORDER BY start_date DESC"
-            
-            cursor.execute(query, params)
-            schedule_ids = [row[0] for row in cursor.fetchall()]
-            
-            return [
-                self.get_schedule_period(schedule_id)
-                for schedule_id in schedule_ids
-            ]
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
+
+        filters = ""
+        params = []
+
+        if start_date:
+            filters += " AND start_date >= ?"
+            params.append(start_date)
+
+        if end_date:
+            filters += " AND end_date <= ?"
+            params.append(end_date)
+
+        if status:
+            filters += " AND status = ?"
+            params.append(status.value)
+
+        # One round-trip: period rows (kind 0) interleaved with their
+        # shift rows (kind 1), sorted so each period immediately precedes
+        # its shifts. The payload columns are wrapped in expressions to
+        # strip their decltypes — both branches share one column list, so
+        # declared-type converters would misfire on the shift rows — and
+        # the date fields are decoded by hand instead.
+        cursor.execute(f'''
+            WITH matched AS (
+                SELECT id, start_date, end_date, status, created_at, updated_at
+                FROM schedule_periods WHERE 1=1 {filters}
+            )
+            SELECT 0 AS kind, start_date AS sort_key, id AS schedule_id,
+                   start_date + 0, end_date + 0, status,
+                   created_at || '', updated_at || ''
+            FROM matched
+            UNION ALL
+            SELECT 1, m.start_date, sa.schedule_id,
+                   sa.id, sa.employee_id, sa.shift_date, sa.shift_type, sa.notes
+            FROM shift_assignments sa
+            JOIN matched m ON sa.schedule_id = m.id
+            ORDER BY sort_key DESC, schedule_id, kind, 6, 7
+        ''', params)
+
+        periods: List[SchedulePeriod] = []
+        shifts: List[ShiftAssignment] = []
+        for row in cursor:
+            if row[0] == 0:
+                shifts = []
+                periods.append(SchedulePeriod._from_row(
+                    id=row[2],
+                    start_date=date.fromordinal(row[3]),
+                    end_date=date.fromordinal(row[4]),
+                    status=_SCHEDULE_STATUS_MAP[row[5]],
+                    created_at=datetime.fromisoformat(row[6]),
+                    updated_at=datetime.fromisoformat(row[7]),
+                    shifts=shifts
+                ))
+            else:
+                shifts.append(ShiftAssignment._from_row(
+                    id=row[3],
+                    employee_id=row[4],
+                    date=date.fromordinal(row[5]),
+                    shift_type=SHIFT_TYPE_BY_CODE[row[6]],
+                    schedule_id=row[2],
+                    notes=row[7]
+                ))
+
+        return periods
+
+    def get_week_view(
+        self,
+        start_date: date,
+        end_date: date
+    ) -> tuple:
+        """
+        Fetch a week's schedule period, its shift assignments and every
+        employee those shifts reference with a single query. Returns
+        (schedule_period_or_None, {employee_id: Employee}); the grid
+        renders from this without any follow-up round trips.
+        """
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
+        cursor.execute(_SELECT_WEEK_VIEW_SQL, (start_date, end_date))
+
+        periods: List[SchedulePeriod] = []
+        shifts_by_schedule: Dict[int, List[ShiftAssignment]] = {}
+        employees: Dict[int, Employee] = {}
+        for row in cursor:
+            kind = row[0]
+            if kind == 0:
+                shifts: List[ShiftAssignment] = []
+                shifts_by_schedule[row[1]] = shifts
+                periods.append(SchedulePeriod._from_row(
+                    id=row[1],
+                    start_date=date.fromordinal(row[2]),
+                    end_date=date.fromordinal(row[3]),
+                    status=_SCHEDULE_STATUS_MAP[row[4]],
+                    created_at=datetime.fromisoformat(row[5]),
+                    updated_at=datetime.fromisoformat(row[6]),
+                    shifts=shifts
+                ))
+            elif kind == 1:
+                shifts_by_schedule[row[2]].append(ShiftAssignment._from_row(
+                    id=row[1],
+                    employee_id=row[3],
+                    date=date.fromordinal(row[4]),
+                    shift_type=SHIFT_TYPE_BY_CODE[row[5]],
+                    schedule_id=row[2],
+                    notes=row[6]
+                ))
+            else:
+                employees[row[1]] = Employee(
+                    id=row[1],
+                    first_name=row[2],
+                    last_name=row[3],
+                    email=row[4],
+                    hire_date=datetime.fromtimestamp(row[5]),
+                    shift_preference=SHIFT_PREFERENCE_BY_CODE[row[6]],
+                    fixed_days_off=unpack_days_off(row[7]),
+                    is_active=row[8] & 1
+                )
+
+        return (periods[0] if periods else None), employees
 
     def update_schedule_status(
         self,
@@ -481,7 +887,7 @@ class DatabaseManager:
         Update the status of a schedule period (e.g., from draft to published).
         Also updates the updated_at timestamp.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             try:
                 cursor.execute('''
@@ -499,41 +905,104 @@ class DatabaseManager:
                 conn.rollback()
                 raise ValueError(f"Failed to update schedule status: {str(e)}")
 
+    def get_shift_employee_ids(
+        self,
+        schedule_id: int,
+        shift_date: date,
+        shift_type: ShiftType
+    ) -> set:
+        """
+        Return the ids of the employees assigned to one shift. A single
+        indexed SELECT, so callers don't scan a whole period's shifts
+        in Python to find one (date, type) slot.
+        """
+        cursor = self._connect().cursor()
+        cursor.execute(_SELECT_SHIFT_EMPLOYEE_IDS_SQL, (
+            schedule_id, shift_date, SHIFT_TYPE_CODES[shift_type]
+        ))
+        return {row[0] for row in cursor.fetchall()}
+
+    def replace_shift_assignments(
+        self,
+        schedule_id: int,
+        shift_date: date,
+        shift_type: ShiftType,
+        employee_ids: List[int]
+    ) -> None:
+        """
+        Replace the staff assigned to one shift with the given employees.
+        The delete and the batch insert run in a single transaction on
+        the shared connection, so callers don't open their own handle.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # Take the write lock up front; a deferred transaction could
+        # hit SQLITE_BUSY upgrading to a write lock partway through.
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            shift_code = SHIFT_TYPE_CODES[shift_type]
+            cursor.execute(
+                _DELETE_SHIFT_SLOT_SQL,
+                (schedule_id, shift_date, shift_code)
+            )
+
+            cursor.executemany(_INSERT_SHIFT_SQL, [
+                {
+                    'schedule_id': schedule_id,
+                    'employee_id': employee_id,
+                    'shift_date': shift_date,
+                    'shift_type': shift_code,
+                    'notes': None
+                }
+                for employee_id in employee_ids
+            ])
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise ValueError(f"Failed to save shift assignments: {str(e)}")
+
     def delete_schedule_period(self, schedule_id: int) -> None:
         """
         Delete a schedule period and all its associated shift assignments.
         Cannot delete published schedules for data integrity.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            try:
-                # Check if schedule is published
-                cursor.execute('''
-                    SELECT status FROM schedule_periods WHERE id = ?
-                ''', (schedule_id,))
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        # Take the write lock up front; a deferred transaction could
+        # hit SQLITE_BUSY upgrading to a write lock partway through.
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            # Check if schedule is published
+            cursor.execute('''
+                SELECT status FROM schedule_periods WHERE id = ?
+            ''', (schedule_id,))
                 
-                result = cursor.fetchone()
-                if not result:
-                    raise ValueError(f"Schedule {schedule_id} not found")
+            result = cursor.fetchone()
+            if not result:
+                raise ValueError(f"Schedule {schedule_id} not found")
                     
-                if ScheduleStatus(result[0]) == ScheduleStatus.PUBLISHED:
-                    raise ValueError("Cannot delete published schedules")
+            if _SCHEDULE_STATUS_MAP[result[0]] == ScheduleStatus.PUBLISHED:
+                raise ValueError("Cannot delete published schedules")
                 
-                # Delete shift assignments first (foreign key constraint)
-                cursor.execute('''
-                    DELETE FROM shift_assignments WHERE schedule_id = ?
-                ''', (schedule_id,))
+            # Delete shift assignments first (foreign key constraint)
+            cursor.execute('''
+                DELETE FROM shift_assignments WHERE schedule_id = ?
+            ''', (schedule_id,))
                 
-                # Delete the schedule period
-                cursor.execute('''
-                    DELETE FROM schedule_periods WHERE id = ?
-                ''', (schedule_id,))
+            # Delete the schedule period
+            cursor.execute('''
+                DELETE FROM schedule_periods WHERE id = ?
+            ''', (schedule_id,))
                 
-                conn.commit()
+            conn.commit()
                 
-            except sqlite3.Error as e:
-                conn.rollback()
-                raise ValueError(f"Failed to delete schedule: {str(e)}")
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise ValueError(f"Failed to delete schedule: {str(e)}")
 
     def get_employee_schedule(
         self,
@@ -545,60 +1014,97 @@ class DatabaseManager:
         Get all shift assignments for a specific employee within a date range.
         Useful for displaying individual schedules and checking availability.
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
             
-            cursor.execute('''
-                SELECT sa.id, sa.shift_date, sa.shift_type,
-                    sa.schedule_id, sa.notes
-                FROM shift_assignments sa
-                JOIN schedule_periods sp ON sa.schedule_id = sp.id
-                WHERE sa.employee_id = ?
-                AND sa.shift_date BETWEEN ? AND ?
-                AND sp.status != 'draft'
-                ORDER BY sa.shift_date, sa.shift_type
-            ''', (
-                employee_id,
-                start_date.isoformat(),
-                end_date.isoformat()
-            ))
+        cursor.execute(_SELECT_EMPLOYEE_SHIFTS_SQL, (
+            employee_id,
+            start_date,
+            end_date
+        ))
             
-            return [
-                ShiftAssignment(
-                    id=row[0],
-                    employee_id=employee_id,
-                    date=date.fromisoformat(row[1]),
-                    shift_type=ShiftType(row[2]),
-                    schedule_id=row[3],
-                    notes=row[4]
-                )
-                for row in cursor.fetchall()
-            ]
+        return [
+            ShiftAssignment._from_row(
+                id=row[0],
+                employee_id=employee_id,
+                date=row[1],
+                shift_type=SHIFT_TYPE_BY_CODE[row[2]],
+                schedule_id=row[3],
+                notes=row[4]
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def get_time_off_requests(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        status: Optional[TimeOffRequestStatus] = None
+    ) -> List[TimeOffRequest]:
+        """
+        Retrieve time-off requests, optionally restricted to those
+        overlapping a date range and/or holding a given status.
+        """
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
+
+        query = '''
+            SELECT id, employee_id, start_date, end_date,
+                   request_type, status, notes
+            FROM time_off_requests
+            WHERE 1=1
+        '''
+        params: List[Any] = []
+
+        # A request overlaps the range when it neither ends before it
+        # starts nor starts after it ends.
+        if start_date:
+            query += ' AND end_date >= ?'
+            params.append(start_date)
+        if end_date:
+            query += ' AND start_date <= ?'
+            params.append(end_date)
+        if status:
+            query += ' AND status = ?'
+            params.append(status.value)
+
+        query += ' ORDER BY start_date'
+        cursor.execute(query, params)
+
+        return [
+            TimeOffRequest._from_row(
+                id=row[0],
+                employee_id=row[1],
+                start_date=row[2],
+                end_date=row[3],
+                request_type=_TIME_OFF_TYPE_MAP[row[4]],
+                status=_TIME_OFF_STATUS_MAP[row[5]],
+                notes=row[6]
+            )
+            for row in cursor.fetchall()
+        ]
 
     def get_active_scheduling_rules(self) -> List[SchedulingRule]:
         """
         Retrieve all active scheduling rules from the database.
         Rules are returned in priority order (highest priority first).
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        # Read-only: use the shared connection directly, without the
+        # transaction context manager and its commit on exit.
+        cursor = self._connect().cursor()
             
-            cursor.execute('''
-                SELECT id, rule_type, priority, parameters,
-                    description, is_active
-                FROM scheduling_rules
-                WHERE is_active = 1
-                ORDER BY priority DESC
-            ''')
+        cursor.execute(_SELECT_ACTIVE_RULES_SQL)
             
-            return [
-                SchedulingRule(
-                    id=row[0],
-                    rule_type=RuleType(row[1]),
-                    priority=row[2],
-                    parameters=json.loads(row[3]),
-                    description=row[4],
-                    is_active=bool(row[5])
-                )
-                for row in cursor.fetchall()
-            ]
\ No newline at end of file
+        return [
+            SchedulingRule(
+                id=row[0],
+                rule_type=RuleType(row[1]),
+                priority=row[2],
+                parameters=_parse_rule_params(row[3]),
+                description=row[4],
+                is_active=row[5] & 1
+            )
+            for row in cursor.fetchall()
+        ]
\ No newline at end of file
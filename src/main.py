@@ -1,26 +1,66 @@
 import sys
-from pathlib import Path
+import threading
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
-from src.ui.main_window import MainWindow
 from src.database.manager import DatabaseManager
+from src.ui.styles import APP_QSS
 
 def main():
     """
     Main entry point of the Staff Scheduler application.
+
+    MainWindow and the UI modules it pulls in are imported only after
+    the QApplication exists, and the database schema is prepared on a
+    worker thread while those imports run, so cold start overlaps the
+    two instead of paying for them back to back.
     """
     # Create the application instance
     app = QApplication(sys.argv)
-    
-    # Initialize the database
+
+    # Skip menu/combo/tooltip animation effects; they schedule extra
+    # repaints for purely cosmetic transitions.
+    for effect in (
+        Qt.UIEffect.UI_AnimateMenu,
+        Qt.UIEffect.UI_FadeMenu,
+        Qt.UIEffect.UI_AnimateCombo,
+        Qt.UIEffect.UI_AnimateTooltip,
+        Qt.UIEffect.UI_FadeTooltip,
+    ):
+        QApplication.setEffectEnabled(effect, False)
+
+    # One shared stylesheet, parsed and cascaded once, instead of
+    # per-widget setStyleSheet copies polished subtree by subtree
+    app.setStyleSheet(APP_QSS)
+
+    # Initialize the database while the UI modules import. Thread
+    # targets swallow exceptions (join() doesn't re-raise), so the
+    # worker stashes any failure for the main thread to raise before
+    # the window is built — a broken schema should fail at startup,
+    # not as error dialogs on every later action.
     db_manager = DatabaseManager("scheduler.db")
-    db_manager.initialize_database()
-    
+    db_failure = []
+
+    def init_db():
+        try:
+            db_manager.initialize_database()
+        except Exception as e:
+            db_failure.append(e)
+
+    db_thread = threading.Thread(target=init_db)
+    db_thread.start()
+
+    from src.ui.main_window import MainWindow
+
+    db_thread.join()
+    if db_failure:
+        raise db_failure[0]
+
     # Create and show the main window with database manager
     window = MainWindow(db_manager)
     window.show()
-    
+
     # Start the application event loop
     sys.exit(app.exec())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
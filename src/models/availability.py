@@ -30,7 +30,7 @@ class ShiftType(Enum):
     DAY = "day"
     NIGHT = "night"
 
-@dataclass
+@dataclass(slots=True)
 class TimeOffRequest:
     """
     Represents a request for time off from an employee.
@@ -49,7 +49,25 @@ class TimeOffRequest:
         if self.start_date >= self.end_date:
             raise ValueError("End date must be after start date")
 
-@dataclass
+    @classmethod
+    def _from_row(cls, id, employee_id, start_date, end_date,
+                  request_type, status, notes):
+        """
+        Build a request from already-stored values, skipping __init__
+        and its validation; stored single-day requests (start equal to
+        end) would otherwise fail the date-order check.
+        """
+        self = cls.__new__(cls)
+        self.id = id
+        self.employee_id = employee_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.request_type = request_type
+        self.status = status
+        self.notes = notes
+        return self
+
+@dataclass(slots=True)
 class EmployeeAvailability:
     """
     Represents an employee's general availability pattern.
@@ -0,0 +1,180 @@
+"""
+CP-SAT backed schedule generation.
+
+When Google OR-Tools is installed, ScheduleGenerator delegates the
+assignment search to the constraint solver in this module instead of
+its greedy pass plus pairwise-swap local search. The model mirrors the
+generator's semantics: one boolean per (date, employee, shift type)
+triple, coverage per shift with slack for unfillable slots, at most one
+shift per employee per day, the max-shifts, consecutive-days-off and
+shift-spacing rules as hard constraints at the same day granularity the
+greedy helpers enforce, and a weighted objective that penalizes
+unfilled slots ahead of preference mismatches.
+
+balance_workload has no analogue in the model: the solver optimizes
+coverage and preferences only, so that option shapes results on the
+greedy path alone.
+
+OR-Tools is an optional dependency; callers must check CPSAT_AVAILABLE
+before calling solve().
+"""
+from datetime import date
+from typing import List, Optional, Tuple
+
+from .schedule import ShiftType
+
+try:
+    from ortools.sat.python import cp_model
+except ImportError:
+    cp_model = None
+
+CPSAT_AVAILABLE = cp_model is not None
+
+# Objective weights, matching _evaluate_schedule's scoring.
+_UNFILLED_WEIGHT = 100
+_MISMATCH_WEIGHT = 10
+
+
+def solve(
+    generator,
+    time_limit_seconds: float = 10.0,
+    num_workers: int = 1
+) -> Optional[List[Tuple[date, ShiftType, int]]]:
+    """
+    Solve the generator's scheduling instance with CP-SAT.
+
+    num_workers feeds the solver's portfolio search, which runs that
+    many cooperating strategies in parallel. Returns a list of
+    (shift_date, shift_type, employee_id) assignments, or None if the
+    solver found no solution within the time limit (the caller then
+    falls back to the greedy pipeline).
+    """
+    model = cp_model.CpModel()
+    dates = generator._date_range()
+    day_count = len(dates)
+    employees = generator._active_employees
+    is_available = generator._is_available
+
+    # One boolean per assignable (date, employee, shift) triple; triples
+    # ruled out by time off or fixed days off are never created, which
+    # prunes the model before the solver sees it. The per-day and
+    # per-employee groupings feed the rule constraints below.
+    assign = {}
+    emp_day_vars = {}
+    emp_vars = {employee.id: [] for employee in employees}
+    for day_index, shift_date in enumerate(dates):
+        for employee in employees:
+            if not is_available(employee.id, shift_date):
+                continue
+            day_vars = []
+            for shift_type in ShiftType:
+                var = model.NewBoolVar(
+                    f"x_{shift_date.toordinal()}_{employee.id}_{shift_type.value}"
+                )
+                assign[(shift_date, employee.id, shift_type)] = var
+                day_vars.append(var)
+            emp_day_vars[(employee.id, day_index)] = day_vars
+            emp_vars[employee.id].extend(day_vars)
+
+    # Coverage: each shift wants min_staff_required people. Slack keeps
+    # the model feasible when staffing is short; the objective makes
+    # every unfilled slot expensive.
+    slacks = []
+    for shift_date in dates:
+        for shift_type in ShiftType:
+            slot_vars = [
+                assign[(shift_date, employee.id, shift_type)]
+                for employee in employees
+                if (shift_date, employee.id, shift_type) in assign
+            ]
+            slack = model.NewIntVar(
+                0, shift_type.min_staff_required,
+                f"unfilled_{shift_date.toordinal()}_{shift_type.value}"
+            )
+            model.Add(sum(slot_vars) + slack >= shift_type.min_staff_required)
+            slacks.append(slack)
+
+    # At most one shift per employee per day.
+    for day_vars in emp_day_vars.values():
+        model.Add(sum(day_vars) <= 1)
+
+    # Rule constraints, from the same parsed buckets the greedy path
+    # checks during candidate selection. MIN_STAFF and
+    # SKILL_REQUIREMENT have no enforcement on the greedy path either
+    # and stay report-only via _evaluate_schedule.
+    for max_count in generator._max_shift_limits:
+        for employee in employees:
+            if emp_vars[employee.id]:
+                model.Add(sum(emp_vars[employee.id]) <= max_count)
+
+    # Shift spacing at day granularity, as in
+    # _would_violate_shift_spacing: 24h and up rules out pairs of
+    # worked days within gap_days of each other; the sub-24h same-day
+    # case is the one-shift-per-day constraint above.
+    for min_hours in generator._spacing_hours:
+        gap_days = min_hours // 24
+        for gap in range(1, gap_days + 1):
+            for day_index in range(day_count - gap):
+                for employee in employees:
+                    near = emp_day_vars.get((employee.id, day_index))
+                    far = emp_day_vars.get((employee.id, day_index + gap))
+                    if near and far:
+                        model.Add(sum(near) + sum(far) <= 1)
+
+    # Consecutive days off, as in _would_violate_consecutive_days:
+    # every employee keeps at least one all-free run of min_days within
+    # the period. One enforced-literal boolean per candidate window;
+    # when no window fits the period the greedy path refuses every
+    # assignment, so the employee is forced empty here too.
+    for min_days in generator._consecutive_day_limits:
+        window_count = day_count - min_days + 1
+        for employee in employees:
+            if not emp_vars[employee.id]:
+                continue
+            if window_count <= 0:
+                model.Add(sum(emp_vars[employee.id]) == 0)
+                continue
+            window_frees = []
+            for start_index in range(window_count):
+                window_vars = [
+                    var
+                    for offset in range(min_days)
+                    for var in emp_day_vars.get(
+                        (employee.id, start_index + offset), ()
+                    )
+                ]
+                free = model.NewBoolVar(
+                    f"free_{employee.id}_{start_index}_{min_days}"
+                )
+                if window_vars:
+                    model.Add(sum(window_vars) == 0).OnlyEnforceIf(free)
+                window_frees.append(free)
+            model.AddBoolOr(window_frees)
+
+    # Minimize unfilled slots first, preference mismatches second, with
+    # the same relative weights the evaluator scores by. The preference
+    # table already resolves respect_preferences=False and
+    # no-preference employees to None, which the evaluator skips — so
+    # must the objective, or the solver would under-schedule them.
+    preferred_by_id = generator._preferred_shift_by_id
+    mismatch_terms = [
+        var for (d, emp_id, shift_type), var in assign.items()
+        if (preferred := preferred_by_id[emp_id]) is not None
+        and preferred is not shift_type
+    ]
+    model.Minimize(
+        _UNFILLED_WEIGHT * sum(slacks) + _MISMATCH_WEIGHT * sum(mismatch_terms)
+    )
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = time_limit_seconds
+    solver.parameters.num_search_workers = num_workers
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return None
+
+    return [
+        (shift_date, shift_type, emp_id)
+        for (shift_date, emp_id, shift_type), var in assign.items()
+        if solver.Value(var)
+    ]
@@ -13,7 +13,17 @@ class RuleType(Enum):
     SKILL_REQUIREMENT = "skill"           # Required skills for shifts
     MAX_SHIFTS = "max_shifts"            # Maximum shifts per period
 
-@dataclass
+# Required parameters per rule type, hoisted out of _validate_parameters
+# so constructing a rule doesn't rebuild the table every time.
+_REQUIRED_PARAMS: Dict[RuleType, frozenset] = {
+    RuleType.MIN_STAFF: frozenset({"shift_type", "min_count"}),
+    RuleType.CONSECUTIVE_DAYS: frozenset({"min_days"}),
+    RuleType.SHIFT_SPACING: frozenset({"min_hours"}),
+    RuleType.SKILL_REQUIREMENT: frozenset({"shift_type", "required_skills"}),
+    RuleType.MAX_SHIFTS: frozenset({"period_days", "max_count"})
+}
+
+@dataclass(slots=True)
 class SchedulingRule:
     """
     Represents a specific scheduling rule or constraint.
@@ -34,14 +44,5 @@ class SchedulingRule:
     
     def _validate_parameters(self):
         """Validates that the rule has all required parameters for its type."""
-        required_params = {
-            RuleType.MIN_STAFF: {"shift_type", "min_count"},
-            RuleType.CONSECUTIVE_DAYS: {"min_days"},
-            RuleType.SHIFT_SPACING: {"min_hours"},
-            RuleType.SKILL_REQUIREMENT: {"shift_type", "required_skills"},
-            RuleType.MAX_SHIFTS: {"period_days", "max_count"}
-        }
-        
-        if not all(param in self.parameters 
-                  for param in required_params[self.rule_type]):
+        if not _REQUIRED_PARAMS[self.rule_type].issubset(self.parameters.keys()):
             raise ValueError(f"Missing required parameters for {self.rule_type}")
\ No newline at end of file
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 class ShiftType(Enum):
     """
@@ -26,7 +27,7 @@ class ScheduleStatus(Enum):
     PUBLISHED = "published"   # Finalized and visible to staff
     ARCHIVED = "archived"     # Past schedule, maintained for records
 
-@dataclass
+@dataclass(slots=True)
 class ShiftAssignment:
     """
     Represents a single shift assignment for one employee.
@@ -38,13 +39,30 @@ class ShiftAssignment:
     shift_type: ShiftType
     schedule_id: int
     notes: Optional[str] = None
-    
+
     def __post_init__(self):
         """Validates the shift assignment data after initialization."""
         if self.date < date.today():
             raise ValueError("Cannot assign shifts in the past")
 
-@dataclass
+    @classmethod
+    def _from_row(cls, id, employee_id, date, shift_type, schedule_id, notes):
+        """
+        Build an assignment from already-stored values, skipping
+        __init__ and its validation. Used by the database fetch loops,
+        which construct one instance per row and load historical
+        shifts that would fail the past-date check.
+        """
+        self = cls.__new__(cls)
+        self.id = id
+        self.employee_id = employee_id
+        self.date = date
+        self.shift_type = shift_type
+        self.schedule_id = schedule_id
+        self.notes = notes
+        return self
+
+@dataclass(slots=True)
 class SchedulePeriod:
     """
     Represents a complete schedule for a specific time period.
@@ -57,10 +75,55 @@ class SchedulePeriod:
     created_at: datetime
     updated_at: datetime
     shifts: List[ShiftAssignment]
-    
+
+    # Lazy (date, shift type) -> employee ids index over shifts; built
+    # on first lookup so repeated per-slot queries don't rescan the
+    # whole shift list.
+    _by_date_type: Optional[Dict[Tuple[date, ShiftType], List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Validates the schedule period after initialization."""
         if self.start_date >= self.end_date:
             raise ValueError("End date must be after start date")
         if self.start_date < date.today():
-            raise ValueError("Cannot create schedule starting in the past")
\ No newline at end of file
+            raise ValueError("Cannot create schedule starting in the past")
+
+    def employee_ids_for(
+        self, shift_date: date, shift_type: ShiftType
+    ) -> List[int]:
+        """
+        Return the ids of the employees assigned to one shift. The
+        first call indexes every shift by (date, type); later calls
+        are dict lookups.
+        """
+        if self._by_date_type is None:
+            index = defaultdict(list)
+            for shift in self.shifts:
+                index[(shift.date, shift.shift_type)].append(shift.employee_id)
+            self._by_date_type = dict(index)
+        return self._by_date_type.get((shift_date, shift_type), [])
+
+    def invalidate_shift_index(self) -> None:
+        """Drop the cached index; call after mutating shifts."""
+        self._by_date_type = None
+
+    @classmethod
+    def _from_row(cls, id, start_date, end_date, status,
+                  created_at, updated_at, shifts):
+        """
+        Build a period from already-stored values, skipping __init__
+        and its validation; past periods loaded from the database would
+        otherwise fail the start-date check.
+        """
+        self = cls.__new__(cls)
+        self.id = id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.status = status
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.shifts = shifts
+        self._by_date_type = None
+        return self
\ No newline at end of file
@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
@@ -7,6 +10,21 @@ from .schedule import ShiftType, ShiftAssignment, SchedulePeriod, ScheduleStatus
 from .availability import TimeOffRequest, TimeOffRequestStatus
 from .rules import SchedulingRule, RuleType
 from ..database.manager import Employee
+from . import cpsat_generator
+
+# Direct value-to-member map, so preference enums resolve to shift
+# types with one dict lookup (same idiom as the database manager).
+_SHIFT_TYPE_BY_VALUE = ShiftType._value2member_map_
+
+# Shift types and their staffing floors, frozen at import. Iterating
+# the tuple skips EnumMeta's __iter__ machinery, and the dict lookup
+# replaces the min_staff_required property call in the hot loops.
+_SHIFT_TYPES = tuple(ShiftType)
+_MIN_STAFF = {shift_type: shift_type.min_staff_required for shift_type in _SHIFT_TYPES}
+
+# Small integer code per shift type, used to pack an assignment into a
+# single int (day_index << 2 | code); _SHIFT_TYPES[code] decodes it.
+_SHIFT_CODES = {shift_type: code for code, shift_type in enumerate(_SHIFT_TYPES)}
 
 @dataclass
 class SchedulingScore:
@@ -24,75 +42,177 @@ class ScheduleGenerator:
                  end_date: date,
                  employees: List[Employee],
                  rules: List[SchedulingRule],
-                 time_off_requests: List[TimeOffRequest]):
+                 time_off_requests: List[TimeOffRequest],
+                 respect_preferences: bool = True,
+                 balance_workload: bool = True):
         """Initialize the schedule generator with necessary data."""
         self.start_date = start_date
         self.end_date = end_date
         self.employees = employees
         self.rules = sorted(rules, key=lambda r: r.priority, reverse=True)
         self.time_off_requests = time_off_requests
-        
+        self.respect_preferences = respect_preferences
+        self.balance_workload = balance_workload
+        self._employees_by_id: Dict[int, Employee] = {e.id: e for e in employees}
+
+        # Inactive employees never become active mid-generation, so they
+        # are filtered once here instead of branch-per-iteration in the
+        # candidate and optimization loops.
+        self._active_employees: List[Employee] = [e for e in employees if e.is_active]
+        self._active_ids: List[int] = [e.id for e in self._active_employees]
+
+        # Each employee's preferred shift resolved to a ShiftType member
+        # once; None for employees with no concrete preference, or for
+        # everyone when preferences are ignored (an all-None table turns
+        # preference scoring and the polish pass into no-ops). The
+        # previous per-shift compare pitted a ShiftPreference against a
+        # ShiftType, which can never be equal, so every assignment
+        # scored as a mismatch.
+        self._preferred_shift_by_id: Dict[int, Optional[ShiftType]] = {
+            e.id: _SHIFT_TYPE_BY_VALUE.get(e.shift_preference.value)
+            if respect_preferences else None
+            for e in employees
+        }
+
+        # Period geometry shared by the availability and worked-day masks
+        self._start_ordinal = start_date.toordinal()
+        self._day_count = end_date.toordinal() - self._start_ordinal + 1
+        self._all_days_mask = (1 << self._day_count) - 1
+
+        # The period's dates, walked once; _date_range is called from
+        # every phase of generation and previously rebuilt this list
+        # with timedelta arithmetic each time.
+        self._dates: List[date] = [
+            date.fromordinal(self._start_ordinal + offset)
+            for offset in range(self._day_count)
+        ]
+
+        # Active rules pre-bucketed by type with their parameters pulled
+        # out, so per-candidate constraint checks neither re-scan the
+        # full priority list nor touch the parameters dict.
+        self._consecutive_day_limits: List[int] = []
+        self._max_shift_limits: List[int] = []
+        self._spacing_hours: List[int] = []
+        for rule in self.rules:
+            if not rule.is_active:
+                continue
+            if rule.rule_type == RuleType.CONSECUTIVE_DAYS:
+                self._consecutive_day_limits.append(rule.parameters["min_days"])
+            elif rule.rule_type == RuleType.MAX_SHIFTS:
+                self._max_shift_limits.append(rule.parameters["max_count"])
+            elif rule.rule_type == RuleType.SHIFT_SPACING:
+                self._spacing_hours.append(rule.parameters["min_hours"])
+
         # Internal state tracking
-        self._employee_availability = self._build_availability_map()
-        self._shift_assignments: Dict[Tuple[date, ShiftType], List[int]] = defaultdict(list)
-        self._employee_shifts: Dict[int, List[Tuple[date, ShiftType]]] = defaultdict(list)
+        self._availability_masks = self._build_availability_masks()
+        self._shift_assignments: Dict[Tuple[date, ShiftType], Set[int]] = defaultdict(set)
 
-    def _build_availability_map(self) -> Dict[Tuple[date, int], bool]:
-        """Create a map of employee availability for each date."""
-        availability = {}
-        
-        # Initialize all dates as available
-        for current_date in self._date_range():
-            for employee in self.employees:
-                if not employee.is_active:
-                    continue
-                availability[(current_date, employee.id)] = True
-                
-        # Mark time off requests as unavailable
+        # Per-employee assignments packed as day_index << 2 | shift
+        # code: one small int per shift instead of a tuple holding a
+        # date and an enum member, so the sets stay compact while the
+        # O(1) membership and removal the swap passes rely on remain.
+        self._employee_shifts: Dict[int, Set[int]] = defaultdict(set)
+
+        # Days each employee works, as a bitmask over the period; the
+        # rule checks test windows and runs with mask arithmetic instead
+        # of walking the assignment lists.
+        self._worked_day_masks: Dict[int, int] = defaultdict(int)
+
+        # Memoized _get_available_employees results, with a reverse map
+        # from employee to the cached keys that include them so an
+        # assignment only invalidates the entries it can affect.
+        self._available_cache: Dict[Tuple[date, ShiftType], List[int]] = {}
+        self._cached_keys_by_employee: Dict[int, Set[Tuple[date, ShiftType]]] = defaultdict(set)
+
+    def _build_availability_masks(self) -> Dict[int, int]:
+        """
+        Build one availability bitmask per active employee, with bit i
+        set when the employee can work day i of the period. A single
+        integer per employee replaces the (date, employee_id) dict and
+        turns each availability check into one shift-and-mask.
+        """
+        day_count = len(self._date_range())
+        all_days = (1 << day_count) - 1
+        start_ordinal = self.start_date.toordinal()
+        start_weekday = self.start_date.weekday()
+
+        # One mask per weekday covering every period day that falls on
+        # it, built in a single pass; each employee's blocked days are
+        # then an OR of their off-weekday masks instead of a walk over
+        # every day of the period.
+        weekday_masks = [0] * 7
+        for day_index in range(day_count):
+            weekday_masks[(start_weekday + day_index) % 7] |= 1 << day_index
+
+        masks = {}
+        for employee in self._active_employees:
+            mask = all_days
+            for weekday in employee.fixed_days_off:
+                mask &= ~weekday_masks[weekday]
+            masks[employee.id] = mask
+
+        # Clear days covered by approved time off, clamped to the period
         for request in self.time_off_requests:
             if request.status != TimeOffRequestStatus.APPROVED:
                 continue
-                
-            current = request.start_date
-            while current <= request.end_date:
-                availability[(current, request.employee_id)] = False
-                current += timedelta(days=1)
-                
-        # Mark fixed days off as unavailable
-        for employee in self.employees:
-            if not employee.is_active:
+            if request.employee_id not in masks:
                 continue
-            for current in self._date_range():
-                if current.weekday() in employee.fixed_days_off:
-                    availability[(current, employee.id)] = False
-                    
-        return availability
+            first = max(request.start_date.toordinal() - start_ordinal, 0)
+            last = min(request.end_date.toordinal() - start_ordinal, day_count - 1)
+            if first > last:
+                continue
+            span = ((1 << (last - first + 1)) - 1) << first
+            masks[request.employee_id] &= ~span
+
+        return masks
+
+    def _available_count(self, shift_date: date) -> int:
+        """Number of employees free on the date, straight from the masks."""
+        day_bit = 1 << (shift_date.toordinal() - self._start_ordinal)
+        return sum(1 for mask in self._availability_masks.values() if mask & day_bit)
+
+    def _is_available(self, employee_id: int, shift_date: date) -> bool:
+        """Check whether an employee can work the given date."""
+        day_index = shift_date.toordinal() - self.start_date.toordinal()
+        return self._availability_masks.get(employee_id, 0) >> day_index & 1 == 1
 
     def _date_range(self) -> List[date]:
-        """Generate list of dates in the scheduling period."""
-        dates = []
-        current = self.start_date
-        while current <= self.end_date:
-            dates.append(current)
-            current += timedelta(days=1)
-        return dates
-
-    def generate_schedule(self) -> Tuple[Optional[SchedulePeriod], List[str]]:
+        """Return the period's dates, precomputed at construction."""
+        return self._dates
+
+    def generate_schedule(
+        self, parallel: Optional[int] = None
+    ) -> Tuple[Optional[SchedulePeriod], List[str]]:
         """
         Generate a complete schedule for the given period.
         Returns the schedule and any warning messages.
+
+        parallel controls how many workers the search uses (default: one
+        per CPU). CP-SAT spreads them over its portfolio search; the
+        greedy pipeline runs that many independently seeded restarts in
+        worker processes and keeps the best-scoring one.
         """
         warnings = []
-        
-        # 1. Generate all required shifts
-        required_shifts = self._generate_required_shifts()
-        
-        # 2. Initial assignment using greedy algorithm
-        self._initial_assignment(required_shifts)
-        
-        # 3. Optimize schedule using local search
-        self._optimize_schedule()
-        
+        if parallel is None:
+            parallel = os.cpu_count() or 1
+
+        # 1-3. Assign shifts: the CP-SAT solver when OR-Tools is
+        # installed, otherwise greedy passes plus local search.
+        if cpsat_generator.CPSAT_AVAILABLE:
+            solution = cpsat_generator.solve(self, num_workers=parallel)
+        elif parallel > 1:
+            solution = self._parallel_restarts(parallel)
+        else:
+            solution = None
+
+        if solution is not None:
+            for shift_date, shift_type, employee_id in solution:
+                self._assign_shift(employee_id, shift_date, shift_type)
+        else:
+            required_shifts = self._generate_required_shifts()
+            self._initial_assignment(required_shifts)
+            self._optimize_schedule()
+
         # 4. Validate final schedule
         score = self._evaluate_schedule()
         
@@ -120,164 +240,411 @@ class ScheduleGenerator:
         
         return schedule, warnings
 
-    def _generate_required_shifts(self) -> List[Tuple[date, ShiftType]]:
-        """Generate list of all shifts that need to be filled."""
-        required_shifts = []
-        for current in self._date_range():
-            for shift_type in ShiftType:
-                for _ in range(shift_type.min_staff_required):
-                    required_shifts.append((current, shift_type))
-        return required_shifts
+    def _parallel_restarts(
+        self, parallel: int
+    ) -> Optional[List[Tuple[date, ShiftType, int]]]:
+        """
+        Run independent greedy + LNS restarts in worker processes and
+        return the best one's assignments. Local search from different
+        seeds is embarrassingly parallel, so the restarts only share
+        the pickled inputs. Returns None when no pool can be created;
+        the caller then runs a single in-process pass.
+        """
+        # Rules loaded through the database manager carry read-only
+        # MappingProxyType parameters, which the pool can't pickle;
+        # workers get copies with plain dicts.
+        rules = [
+            rule if isinstance(rule.parameters, dict)
+            else replace(rule, parameters=dict(rule.parameters))
+            for rule in self.rules
+        ]
+        args = [
+            (self.start_date, self.end_date, self.employees,
+             rules, self.time_off_requests,
+             self.respect_preferences, self.balance_workload, seed)
+            for seed in range(parallel)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=parallel) as pool:
+                results = list(pool.map(_run_restart, args))
+        except (OSError, RuntimeError):
+            # No usable pool (restricted platform, broken worker):
+            # fall back to the sequential pipeline
+            return None
+
+        _, best = max(results, key=lambda result: result[0])
+        return best
 
-    def _initial_assignment(self, required_shifts: List[Tuple[date, ShiftType]]) -> None:
+    def _generate_required_shifts(self) -> List[Tuple[date, ShiftType, int]]:
+        """
+        Generate the shifts that need to be filled, one entry per
+        (date, shift type) slot carrying its seat count instead of one
+        duplicate entry per seat.
+        """
+        return [
+            (current, shift_type, _MIN_STAFF[shift_type])
+            for current in self._date_range()
+            for shift_type in _SHIFT_TYPES
+        ]
+
+    def _initial_assignment(
+        self, required_shifts: List[Tuple[date, ShiftType, int]]
+    ) -> None:
         """
         Make initial shift assignments using a greedy algorithm.
         Prioritize employee preferences and availability.
         """
         # Sort shifts by difficulty of assignment
         shifts_by_difficulty = self._sort_shifts_by_difficulty(required_shifts)
-        
-        for shift_date, shift_type in shifts_by_difficulty:
-            # Get available employees sorted by suitability
+
+        for shift_date, shift_type, needed in shifts_by_difficulty:
+            # One rule-checked candidate lookup covers every seat of the
+            # slot; seating one candidate doesn't change whether the
+            # others can take the same slot, so the sorted prefix fills
+            # all of them.
             available_employees = self._get_available_employees(shift_date, shift_type)
-            
-            if not available_employees:
-                continue
-                
-            # Assign the most suitable available employee
-            employee_id = available_employees[0]
-            self._assign_shift(employee_id, shift_date, shift_type)
+            for employee_id in available_employees[:needed]:
+                self._assign_shift(employee_id, shift_date, shift_type)
 
     def _sort_shifts_by_difficulty(
-        self, shifts: List[Tuple[date, ShiftType]]
-    ) -> List[Tuple[date, ShiftType]]:
+        self, shifts: List[Tuple[date, ShiftType, int]]
+    ) -> List[Tuple[date, ShiftType, int]]:
         """Sort shifts by how difficult they are to fill based on availability."""
+        # Before anything is assigned no rule can bind, so the head
+        # count comes straight from the availability masks instead of
+        # running the full rule-checked lookup per slot.
+        counts: Dict[date, int] = {}
         shift_scores = []
-        for shift_date, shift_type in shifts:
-            available = len(self._get_available_employees(shift_date, shift_type))
-            shift_scores.append((available, (shift_date, shift_type)))
-            
-        # Sort by number of available employees (ascending)
-        shift_scores.sort()
-        return [shift for _, shift in shift_scores]
+        for slot in shifts:
+            available = counts.get(slot[0])
+            if available is None:
+                available = counts[slot[0]] = self._available_count(slot[0])
+            shift_scores.append((available, slot))
+
+        # Sort by number of available employees (ascending). Sort on the
+        # count alone: ties would otherwise fall through to comparing
+        # ShiftType members, which don't define an ordering.
+        shift_scores.sort(key=lambda score: score[0])
+        return [slot for _, slot in shift_scores]
 
     def _get_available_employees(
         self, shift_date: date, shift_type: ShiftType
     ) -> List[int]:
         """Get list of employee IDs available for given shift, sorted by suitability."""
+        key = (shift_date, shift_type)
+        cached = self._available_cache.get(key)
+        if cached is not None:
+            return cached
+
         available = []
-        
-        for employee in self.employees:
-            if not employee.is_active:
-                continue
-                
-            if not self._employee_availability[(shift_date, employee.id)]:
+
+        for employee in self._active_employees:
+            if not self._is_available(employee.id, shift_date):
                 continue
-                
+
             if self._violates_constraints(employee.id, shift_date, shift_type):
                 continue
-                
+
             available.append(employee.id)
-            
-        # Sort by preference and previous assignments
-        return sorted(
-            available,
-            key=lambda x: (
-                self._preference_score(x, shift_type),
-                -len(self._employee_shifts[x])
+
+        # Sort by preference (matches first), then by load so lightly
+        # assigned employees fill seats ahead of busy ones — unless
+        # workload balancing is off, in which case preference alone
+        # decides the order
+        if self.balance_workload:
+            available.sort(
+                key=lambda x: (
+                    -self._preference_score(x, shift_type),
+                    len(self._employee_shifts[x])
+                )
             )
-        )
+        else:
+            available.sort(
+                key=lambda x: -self._preference_score(x, shift_type)
+            )
+
+        self._available_cache[key] = available
+        for employee_id in available:
+            self._cached_keys_by_employee[employee_id].add(key)
+        return available
+
+    def _invalidate_availability(self, employee_id: int) -> None:
+        """
+        Drop cached availability entries affected by assigning a shift
+        to this employee; entries that exclude them stay valid.
+        """
+        for key in self._cached_keys_by_employee.pop(employee_id, ()):
+            cached = self._available_cache.pop(key, None)
+            if cached is None:
+                continue
+            for other_id in cached:
+                if other_id != employee_id:
+                    self._cached_keys_by_employee[other_id].discard(key)
 
     def _violates_constraints(
         self, employee_id: int, shift_date: date, shift_type: ShiftType
     ) -> bool:
         """Check if assigning this shift would violate any scheduling rules."""
-        for rule in self.rules:
-            if not rule.is_active:
-                continue
-                
-            if rule.rule_type == RuleType.CONSECUTIVE_DAYS:
-                # Check consecutive days constraint
-                consecutive_days = rule.parameters["min_days"]
-                if self._would_violate_consecutive_days(
-                    employee_id, shift_date, consecutive_days
-                ):
-                    return True
-                    
-            elif rule.rule_type == RuleType.MAX_SHIFTS:
-                # Check maximum shifts constraint
-                if self._would_exceed_max_shifts(
-                    employee_id, rule.parameters["max_count"]
-                ):
-                    return True
-                    
-            elif rule.rule_type == RuleType.SHIFT_SPACING:
-                # Check minimum hours between shifts
-                if self._would_violate_shift_spacing(
-                    employee_id, shift_date, shift_type,
-                    rule.parameters["min_hours"]
-                ):
-                    return True
-                    
+        for min_days in self._consecutive_day_limits:
+            if self._would_violate_consecutive_days(
+                employee_id, shift_date, min_days
+            ):
+                return True
+
+        for max_count in self._max_shift_limits:
+            if self._would_exceed_max_shifts(employee_id, max_count):
+                return True
+
+        for min_hours in self._spacing_hours:
+            if self._would_violate_shift_spacing(
+                employee_id, shift_date, shift_type, min_hours
+            ):
+                return True
+
+        return False
+
+    def _would_exceed_max_shifts(self, employee_id: int, max_count: int) -> bool:
+        """Check whether one more shift would push the employee past max_count."""
+        return len(self._employee_shifts[employee_id]) >= max_count
+
+    def _has_days_off_run(self, worked_mask: int, min_days: int) -> bool:
+        """
+        Check for a run of at least min_days free days in the period.
+        Each AND-with-shift halves candidate runs, so the check is
+        min_days - 1 mask operations with no per-day loop.
+        """
+        free = ~worked_mask & self._all_days_mask
+        for _ in range(min_days - 1):
+            free &= free >> 1
+            if not free:
+                return False
+        return free != 0
+
+    def _would_violate_consecutive_days(
+        self, employee_id: int, shift_date: date, min_days: int
+    ) -> bool:
+        """
+        Check whether working shift_date would leave the employee
+        without any run of at least min_days consecutive days off
+        within the scheduling period.
+        """
+        day_index = shift_date.toordinal() - self._start_ordinal
+        return not self._has_days_off_run(
+            self._worked_day_masks[employee_id] | (1 << day_index), min_days
+        )
+
+    def _would_violate_shift_spacing(
+        self, employee_id: int, shift_date: date,
+        shift_type: ShiftType, min_hours: int
+    ) -> bool:
+        """
+        Check whether the shift would fall too close to one the
+        employee already works. Shift types carry no clock times, so
+        the hour threshold is applied at day granularity: 8-23 hours
+        blocks a second shift the same day, 24+ blocks adjacent days.
+        """
+        gap_days = min_hours // 24
+        day_index = shift_date.toordinal() - self._start_ordinal
+        low = max(day_index - gap_days, 0)
+        window = ((1 << (day_index + gap_days - low + 1)) - 1) << low
+        return bool(self._worked_day_masks[employee_id] & window)
+
+    def _check_rule_violation(self, employee_id: int, rule: SchedulingRule) -> bool:
+        """Check whether an employee's current assignments violate a rule."""
+        shifts = self._employee_shifts[employee_id]
+        if not shifts:
+            return False
+
+        if rule.rule_type == RuleType.MAX_SHIFTS:
+            return len(shifts) > rule.parameters["max_count"]
+
+        if rule.rule_type == RuleType.CONSECUTIVE_DAYS:
+            return not self._has_days_off_run(
+                self._worked_day_masks[employee_id], rule.parameters["min_days"]
+            )
+
+        if rule.rule_type == RuleType.SHIFT_SPACING:
+            gap_days = rule.parameters["min_hours"] // 24
+            mask = self._worked_day_masks[employee_id]
+            # Two shifts on one day collapse into a single bit
+            if len(shifts) > mask.bit_count():
+                return True
+            return any(mask & (mask >> gap) for gap in range(1, gap_days + 1))
+
         return False
 
     def _preference_score(self, employee_id: int, shift_type: ShiftType) -> int:
         """Calculate how well this shift matches employee preferences."""
-        employee = next(e for e in self.employees if e.id == employee_id)
-        return 1 if employee.shift_preference == shift_type else 0
+        return 1 if self._preferred_shift_by_id[employee_id] is shift_type else 0
 
     def _assign_shift(
         self, employee_id: int, shift_date: date, shift_type: ShiftType
     ) -> None:
         """Assign a shift to an employee."""
-        self._shift_assignments[(shift_date, shift_type)].append(employee_id)
-        self._employee_shifts[employee_id].append((shift_date, shift_type))
+        day_index = shift_date.toordinal() - self._start_ordinal
+        self._shift_assignments[(shift_date, shift_type)].add(employee_id)
+        self._employee_shifts[employee_id].add(
+            day_index << 2 | _SHIFT_CODES[shift_type]
+        )
+        self._worked_day_masks[employee_id] |= 1 << day_index
+        self._invalidate_availability(employee_id)
+
+    # Ruin-and-repair rounds attempted before the polish pass.
+    LNS_ITERATIONS = 50
 
-    def _optimize_schedule(self) -> None:
+    def _optimize_schedule(self, seed: Optional[int] = None) -> None:
         """
-        Improve the schedule using local search.
-        Try to reduce constraint violations and improve preference matching.
+        Improve the schedule using large-neighborhood search: ruin a
+        small fragment (one employee's assignments), repair the holes
+        greedily, and keep the result only when the score improves.
+        A single pairwise swap pass then polishes what remains, instead
+        of the previous full O(shifts² · employees²) swap loop.
         """
-        improved = True
-        iterations = 0
-        max_iterations = 1000
-        
-        while improved and iterations < max_iterations:
-            improved = False
-            current_score = self._evaluate_schedule()
-            
-            # Try swapping shifts between employees
-            for (date1, type1), employees1 in self._shift_assignments.items():
-                for (date2, type2), employees2 in self._shift_assignments.items():
-                    if date1 == date2 and type1 == type2:
+        self._lns_optimize(seed)
+        self._polish_swaps()
+
+    def _lns_optimize(self, seed: Optional[int] = None) -> None:
+        """Run destroy/repair rounds, reverting any that don't improve."""
+        # Deterministic by default; parallel restarts pass distinct
+        # seeds so their searches diverge.
+        if seed is None:
+            seed = len(self._employee_shifts)
+        rng = random.Random(seed)
+        employee_ids = self._active_ids
+        if not employee_ids:
+            return
+
+        current_score = self._evaluate_schedule().total_score
+        for _ in range(self.LNS_ITERATIONS):
+            removed = self._ruin(rng.choice(employee_ids))
+            if not removed:
+                continue
+
+            added = self._repair()
+            new_score = self._evaluate_schedule().total_score
+            if new_score > current_score:
+                current_score = new_score
+                continue
+
+            # Revert: undo the repair, restore the ruined fragment
+            for employee_id, shift_date, shift_type in added:
+                self._remove_shift(employee_id, shift_date, shift_type)
+            for employee_id, shift_date, shift_type in removed:
+                self._assign_shift(employee_id, shift_date, shift_type)
+
+    def _ruin(self, employee_id: int) -> List[Tuple[int, date, ShiftType]]:
+        """Remove one employee's assignments, returning what was removed."""
+        dates = self._dates
+        removed = [
+            (employee_id, dates[packed >> 2], _SHIFT_TYPES[packed & 3])
+            for packed in self._employee_shifts[employee_id]
+        ]
+        for _, shift_date, shift_type in removed:
+            self._remove_shift(employee_id, shift_date, shift_type)
+        return removed
+
+    def _repair(self) -> List[Tuple[int, date, ShiftType]]:
+        """
+        Greedily refill every under-covered slot, skipping employees
+        already working that day. Returns the assignments made.
+        """
+        added = []
+        worked = self._worked_day_masks
+        for day_index, shift_date in enumerate(self._date_range()):
+            day_bit = 1 << day_index
+            for shift_type in _SHIFT_TYPES:
+                bucket = self._shift_assignments[(shift_date, shift_type)]
+                while len(bucket) < _MIN_STAFF[shift_type]:
+                    candidate = next(
+                        (
+                            employee_id
+                            for employee_id in self._get_available_employees(
+                                shift_date, shift_type
+                            )
+                            if not worked[employee_id] & day_bit
+                        ),
+                        None
+                    )
+                    if candidate is None:
+                        break
+                    self._assign_shift(candidate, shift_date, shift_type)
+                    added.append((candidate, shift_date, shift_type))
+        return added
+
+    def _remove_shift(
+        self, employee_id: int, shift_date: date, shift_type: ShiftType
+    ) -> None:
+        """Undo a single assignment and drop the availability memo."""
+        day_index = shift_date.toordinal() - self._start_ordinal
+        self._shift_assignments[(shift_date, shift_type)].remove(employee_id)
+        self._employee_shifts[employee_id].remove(
+            day_index << 2 | _SHIFT_CODES[shift_type]
+        )
+        # Clear the day bit unless another same-day shift remains
+        if not any(p >> 2 == day_index for p in self._employee_shifts[employee_id]):
+            self._worked_day_masks[employee_id] &= ~(1 << day_index)
+        self._available_cache.clear()
+        self._cached_keys_by_employee.clear()
+
+    def _polish_swaps(self) -> None:
+        """
+        One pairwise swap pass to shake out preference mismatches.
+
+        The swap delta is symmetric, so each unordered pair of slots is
+        visited once, and only the preference term can move (a swap
+        keeps both slots filled). The delta is inlined as identity
+        checks against the preference table, with hot names bound
+        locally — this loop dominates the polish phase, so it stays
+        free of per-iteration attribute and method dispatch.
+        """
+        preferred = self._preferred_shift_by_id
+        shift_assignments = self._shift_assignments
+        try_swap = self._try_swap
+
+        keys = list(shift_assignments.keys())
+        for i, (date1, type1) in enumerate(keys):
+            for date2, type2 in keys[i + 1:]:
+                # Same type on both sides can't change the preference
+                # term, so the whole bucket pair is skipped
+                if type1 is type2:
+                    continue
+
+                bucket2 = shift_assignments[(date2, type2)]
+                for emp1 in list(shift_assignments[(date1, type1)]):
+                    pref1 = preferred[emp1]
+                    gain1 = (pref1 is type2) - (pref1 is type1)
+                    if gain1 < 0:
                         continue
-                        
-                    for emp1 in employees1:
-                        for emp2 in employees2:
-                            if self._try_swap(emp1, date1, type1, emp2, date2, type2):
-                                new_score = self._evaluate_schedule()
-                                if new_score.total_score > current_score.total_score:
-                                    improved = True
-                                else:
-                                    # Revert the swap
-                                    self._try_swap(emp2, date1, type1, emp1, date2, type2)
-                                    
-            iterations += 1
+                    for emp2 in list(bucket2):
+                        if emp1 == emp2:
+                            continue
+                        pref2 = preferred[emp2]
+                        # Only attempt swaps the delta says will help;
+                        # _try_swap still rejects rule violations. A
+                        # successful swap moves emp1 out of this bucket,
+                        # so stop offering them further partners.
+                        if gain1 + (pref2 is type1) - (pref2 is type2) > 0:
+                            if try_swap(emp1, date1, type1, emp2, date2, type2):
+                                break
 
     def _try_swap(
         self, emp1: int, date1: date, type1: ShiftType,
         emp2: int, date2: date, type2: ShiftType
     ) -> bool:
         """Attempt to swap shifts between two employees."""
-        # Remove current assignments
-        self._shift_assignments[(date1, type1)].remove(emp1)
-        self._shift_assignments[(date2, type2)].remove(emp2)
-        self._employee_shifts[emp1].remove((date1, type1))
-        self._employee_shifts[emp2].remove((date2, type2))
+        # Remove current assignments (_remove_shift also keeps the
+        # worked-day masks current and drops the availability memo)
+        self._remove_shift(emp1, date1, type1)
+        self._remove_shift(emp2, date2, type2)
         
-        # Check if new assignments would be valid
-        valid1 = not self._violates_constraints(emp2, date1, type1)
-        valid2 = not self._violates_constraints(emp1, date2, type2)
+        # Check if new assignments would be valid. A swap moves each
+        # employee to the other's date, so availability (fixed days
+        # off, approved time off) must hold there too, not just the
+        # rule limits.
+        valid1 = (self._is_available(emp2, date1)
+                  and not self._violates_constraints(emp2, date1, type1))
+        valid2 = (self._is_available(emp1, date2)
+                  and not self._violates_constraints(emp1, date2, type2))
         
         if valid1 and valid2:
             # Make new assignments
@@ -296,22 +663,30 @@ class ScheduleGenerator:
         mismatches = 0
         violations = []
         
-        # Check shift coverage
+        # Check shift coverage. .get avoids growing the defaultdict
+        # with empty buckets for unassigned slots.
+        shift_assignments = self._shift_assignments
+        min_staff = _MIN_STAFF
         for current in self._date_range():
-            for shift_type in ShiftType:
-                assigned = len(self._shift_assignments[(current, shift_type)])
-                if assigned < shift_type.min_staff_required:
-                    unfilled += shift_type.min_staff_required - assigned
-                    
+            for shift_type in _SHIFT_TYPES:
+                required = min_staff[shift_type]
+                assigned = len(shift_assignments.get((current, shift_type), ()))
+                if assigned < required:
+                    unfilled += required - assigned
+
         # Check preferences and rules
+        preferred_by_id = self._preferred_shift_by_id
         for employee_id, shifts in self._employee_shifts.items():
-            employee = next(e for e in self.employees if e.id == employee_id)
-            
-            # Count preference mismatches
-            for _, shift_type in shifts:
-                if shift_type != employee.shift_preference:
-                    mismatches += 1
-                    
+            employee = self._employees_by_id[employee_id]
+
+            # Count preference mismatches against the precomputed table
+            preferred = preferred_by_id[employee_id]
+            if preferred is not None:
+                preferred_code = _SHIFT_CODES[preferred]
+                mismatches += sum(
+                    1 for packed in shifts if packed & 3 != preferred_code
+                )
+
             # Check rule violations
             for rule in self.rules:
                 if not rule.is_active:
@@ -329,16 +704,45 @@ class ScheduleGenerator:
 
     def _create_shift_assignments(self) -> List[ShiftAssignment]:
         """Convert internal assignment tracking to ShiftAssignment objects."""
-        assignments = []
-        
-        for (shift_date, shift_type), employees in self._shift_assignments.items():
-            for employee_id in employees:
-                assignments.append(ShiftAssignment(
-                    id=None,
-                    employee_id=employee_id,
-                    date=shift_date,
-                    shift_type=shift_type,
-                    schedule_id=0  # Will be set when schedule is saved
-                ))
-                
-        return assignments
\ No newline at end of file
+        # _from_row skips __post_init__, whose date.today() call and
+        # past-date check would run once per assignment; every date here
+        # came from the validated period, so re-checking buys nothing.
+        return [
+            ShiftAssignment._from_row(
+                id=None,
+                employee_id=employee_id,
+                date=shift_date,
+                shift_type=shift_type,
+                schedule_id=0,  # Will be set when schedule is saved
+                notes=None
+            )
+            for (shift_date, shift_type), employees in self._shift_assignments.items()
+            for employee_id in employees
+        ]
+
+
+def _run_restart(
+    args: Tuple[date, date, List[Employee], List[SchedulingRule],
+                List[TimeOffRequest], bool, bool, int]
+) -> Tuple[float, List[Tuple[date, ShiftType, int]]]:
+    """
+    Worker for _parallel_restarts: one full greedy + LNS pass with the
+    given seed, returning the score and the resulting assignments.
+    Module-level so the process pool can pickle it.
+    """
+    (start_date, end_date, employees, rules, time_off_requests,
+     respect_preferences, balance_workload, seed) = args
+    generator = ScheduleGenerator(
+        start_date, end_date, employees, rules, time_off_requests,
+        respect_preferences=respect_preferences,
+        balance_workload=balance_workload
+    )
+    generator._initial_assignment(generator._generate_required_shifts())
+    generator._optimize_schedule(seed)
+    score = generator._evaluate_schedule().total_score
+    assignments = [
+        (shift_date, shift_type, employee_id)
+        for (shift_date, shift_type), bucket in generator._shift_assignments.items()
+        for employee_id in bucket
+    ]
+    return score, assignments
@@ -16,6 +16,9 @@ class EmployeeDialog(QDialog):
     def init_ui(self) -> None:
         """Initialize the dialog UI components."""
         self.setWindowTitle("Employee Details")
+        # Dialog styling comes from the application stylesheet,
+        # keyed on this object name
+        self.setObjectName("employeeDialog")
         self.setModal(True)
         
         layout = QVBoxLayout()
@@ -50,65 +53,6 @@ class EmployeeDialog(QDialog):
         self.is_active = QCheckBox("Active Employee")
         self.is_active.setChecked(True)
         
-        # Apply modern styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-                margin-top: 12px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                background-color: transparent;
-                padding: 5px;
-            }
-            QLineEdit {
-                padding: 8px;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #2563eb;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton#save_btn {
-                background-color: #2563eb;
-                color: white;
-                border: none;
-            }
-            QPushButton#save_btn:hover {
-                background-color: #1d4ed8;
-            }
-            QPushButton#cancel_btn {
-                background-color: #f3f4f6;
-                border: 1px solid #e0e0e0;
-            }
-            QPushButton#cancel_btn:hover {
-                background-color: #e5e7eb;
-            }
-            QComboBox {
-                padding: 8px;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 5px solid #666;
-                margin-right: 8px;
-            }
-        """)
             
         # Add fields to form layout
         form_layout.addRow("First Name:", self.first_name)
@@ -122,7 +66,9 @@ class EmployeeDialog(QDialog):
         # Add buttons
         button_layout = QHBoxLayout()
         save_button = QPushButton("Save")
+        save_button.setObjectName("save_btn")
         cancel_button = QPushButton("Cancel")
+        cancel_button.setObjectName("cancel_btn")
         
         save_button.clicked.connect(self.accept)
         cancel_button.clicked.connect(self.reject)
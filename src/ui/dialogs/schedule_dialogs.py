@@ -1,11 +1,11 @@
 from datetime import date
 from typing import Optional
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QDialog, QVBoxLayout, QHBoxLayout, QListView,
     QPushButton, QLabel, QCheckBox, QMessageBox, QWidget
 )
-from PyQt6.QtCore import Qt
-import sqlite3
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QStandardItem, QStandardItemModel
 
 from src.models.scheduler import ScheduleGenerator
 
@@ -13,6 +13,36 @@ from ...database.manager import DatabaseManager
 from ...models.schedule import SchedulePeriod, ShiftType
 from ...models.availability import TimeOffRequestStatus
 
+# Shared brush marking employees whose preference matches the shift
+# being edited; one brush serves every item instead of a QColor (or,
+# before that, a parsed stylesheet) per matching row.
+_PREFERRED_BRUSH = QBrush(QColor("green"))
+
+class _ScheduleJobSignals(QObject):
+    """Signals for ScheduleJob; QRunnable itself can't emit them."""
+    finished = pyqtSignal(object, list)
+    failed = pyqtSignal(str)
+
+class ScheduleJob(QRunnable):
+    """
+    Runs schedule generation on a pool thread. Generation is seconds of
+    pure-Python work for a real roster; doing it inside the click
+    handler would freeze the event loop for the duration.
+    """
+
+    def __init__(self, generator: ScheduleGenerator):
+        super().__init__()
+        self.generator = generator
+        self.signals = _ScheduleJobSignals()
+
+    def run(self) -> None:
+        try:
+            schedule, warnings = self.generator.generate_schedule()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(schedule, warnings)
+
 class GenerateScheduleDialog(QDialog):
     """Dialog for generating a new schedule."""
     
@@ -55,17 +85,17 @@ class GenerateScheduleDialog(QDialog):
         
         # Add buttons
         button_layout = QHBoxLayout()
-        generate_button = QPushButton("Generate")
-        generate_button.clicked.connect(self._generate_schedule)
+        self.generate_button = QPushButton("Generate")
+        self.generate_button.clicked.connect(self._generate_schedule)
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
-        
-        button_layout.addWidget(generate_button)
+
+        button_layout.addWidget(self.generate_button)
         button_layout.addWidget(cancel_button)
         layout.addLayout(button_layout)
         
     def _generate_schedule(self) -> None:
-        """Generate the schedule with selected options."""
+        """Kick off schedule generation on a worker thread."""
         try:
             # Get required data
             employees = self.db_manager.get_all_employees(active_only=True)
@@ -86,30 +116,45 @@ class GenerateScheduleDialog(QDialog):
                 respect_preferences=self.respect_preferences.isChecked(),
                 balance_workload=self.balance_shifts.isChecked()
             )
-            
-            # Generate schedule
-            schedule, warnings = generator.generate_schedule()
-            
-            # Save to database
-            schedule_id = self.db_manager.create_schedule_period(schedule)
-            
-            # Show warnings if any
-            if warnings:
-                QMessageBox.warning(
-                    self,
-                    "Schedule Generation Warnings",
-                    "\n".join(warnings)
-                )
-                
-            self.accept()
-            
+
+            # Generate on the pool so the event loop keeps painting;
+            # the job signals back onto this (the GUI) thread
+            self.generate_button.setEnabled(False)
+            job = ScheduleJob(generator)
+            job.signals.finished.connect(self._on_generation_finished)
+            job.signals.failed.connect(self._on_generation_failed)
+            QThreadPool.globalInstance().start(job)
+
         except Exception as e:
-            QMessageBox.critical(
+            self._on_generation_failed(str(e))
+
+    def _on_generation_finished(self, schedule, warnings: list) -> None:
+        """Save the generated schedule and close the dialog."""
+        try:
+            self.db_manager.create_schedule_period(schedule)
+        except Exception as e:
+            self._on_generation_failed(str(e))
+            return
+
+        # Show warnings if any
+        if warnings:
+            QMessageBox.warning(
                 self,
-                "Generation Error",
-                f"Failed to generate schedule: {str(e)}"
+                "Schedule Generation Warnings",
+                "\n".join(warnings)
             )
 
+        self.accept()
+
+    def _on_generation_failed(self, message: str) -> None:
+        """Re-enable the dialog and report the failure."""
+        self.generate_button.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            "Generation Error",
+            f"Failed to generate schedule: {message}"
+        )
+
 class EditShiftsDialog(QDialog):
     """Dialog for editing shift assignments."""
     
@@ -135,42 +180,54 @@ class EditShiftsDialog(QDialog):
             f"{self.shift_date.strftime('%B %d, %Y')}"
         )
         layout = QVBoxLayout(self)
-        
-        # Add employee selection grid
-        self.employee_grid = QGridLayout()
-        
-        # Get current assignments
-        current_staff = []
-        for shift in self.schedule.shifts:
-            if (shift.date == self.shift_date and 
-                shift.shift_type == self.shift_type):
-                employee = self.db_manager.get_employee(shift.employee_id)
-                if employee:
-                    current_staff.append(employee.id)
-                    
-        # Add employee checkboxes
-        row = 0
-        col = 0
-        max_cols = 2
-        
-        self.employee_boxes = {}
-        for employee in self.db_manager.get_all_employees(active_only=True):
-            checkbox = QCheckBox(employee.full_name)
-            checkbox.setChecked(employee.id in current_staff)
-            
+
+        # One employee fetch serves both the current-staff lookup and
+        # the selection list; the shifts already carry the employee ids,
+        # so there's no per-shift get_employee round trip.
+        employees = self.db_manager.get_all_employees(active_only=True)
+
+        # Get current assignments with one indexed SELECT instead of
+        # scanning every shift in the period here
+        current_staff = self.db_manager.get_shift_employee_ids(
+            self.schedule.id, self.shift_date, self.shift_type
+        )
+
+        # Employee selection: checkable items in a QListView rather
+        # than one QCheckBox widget per employee — the view only paints
+        # visible rows, so a large roster doesn't mean building and
+        # laying out a large widget tree before the dialog shows
+        # shift_preference and ShiftType are different enums sharing
+        # value strings, so the match is on .value; the old direct
+        # enum compare could never be true and the indicator never
+        # showed.
+        preferred_value = self.shift_type.value
+
+        self.employee_model = QStandardItemModel(self)
+        for employee in employees:
+            item = QStandardItem(employee.full_name)
+            item.setCheckable(True)
+            item.setEditable(False)
+            item.setCheckState(
+                Qt.CheckState.Checked if employee.id in current_staff
+                else Qt.CheckState.Unchecked
+            )
+            item.setData(employee.id, Qt.ItemDataRole.UserRole)
+
             # Add visual indicator for employee preferences
-            if employee.shift_preference == self.shift_type:
-                checkbox.setStyleSheet("QCheckBox { color: green; }")
-                
-            self.employee_boxes[employee.id] = checkbox
-            self.employee_grid.addWidget(checkbox, row, col)
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
-                
-        layout.addLayout(self.employee_grid)
+            if employee.shift_preference.value == preferred_value:
+                item.setForeground(_PREFERRED_BRUSH)
+
+            self.employee_model.appendRow(item)
+
+        self.employee_view = QListView()
+        self.employee_view.setModel(self.employee_model)
+
+        # Keep the old two-column grid look
+        self.employee_view.setFlow(QListView.Flow.LeftToRight)
+        self.employee_view.setWrapping(True)
+        self.employee_view.setResizeMode(QListView.ResizeMode.Adjust)
+
+        layout.addWidget(self.employee_view)
         
         # Add staffing requirement note
         layout.addWidget(QLabel(
@@ -190,9 +247,11 @@ class EditShiftsDialog(QDialog):
         
     def accept(self) -> None:
         """Validate and save the shift changes."""
+        model = self.employee_model
         selected_employees = [
-            emp_id for emp_id, checkbox in self.employee_boxes.items()
-            if checkbox.isChecked()
+            item.data(Qt.ItemDataRole.UserRole)
+            for item in (model.item(row) for row in range(model.rowCount()))
+            if item.checkState() == Qt.CheckState.Checked
         ]
         
         # Validate minimum staffing
@@ -206,41 +265,17 @@ class EditShiftsDialog(QDialog):
             return
             
         try:
-            # Update database
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Remove existing assignments
-                cursor.execute('''
-                    DELETE FROM shift_assignments
-                    WHERE schedule_id = ?
-                    AND shift_date = ?
-                    AND shift_type = ?
-                ''', (
-                    self.schedule.id,
-                    self.shift_date.isoformat(),
-                    self.shift_type.value
-                ))
-                
-                # Add new assignments
-                for employee_id in selected_employees:
-                    cursor.execute('''
-                        INSERT INTO shift_assignments (
-                            schedule_id, employee_id, shift_date,
-                            shift_type, notes
-                        ) VALUES (?, ?, ?, ?, ?)
-                    ''', (
-                        self.schedule.id,
-                        employee_id,
-                        self.shift_date.isoformat(),
-                        self.shift_type.value,
-                        None
-                    ))
-                    
-                conn.commit()
-                
+            # Update through the manager's already-open connection
+            # instead of paying to open a fresh one per save
+            self.db_manager.replace_shift_assignments(
+                self.schedule.id,
+                self.shift_date,
+                self.shift_type,
+                selected_employees
+            )
+
             super().accept()
-            
+
         except Exception as e:
             QMessageBox.critical(
                 self,
@@ -0,0 +1,168 @@
+"""
+Application-wide stylesheet.
+
+Every widget sheet previously set with its own setStyleSheet call is
+consolidated here and applied once to the QApplication in main(). Qt
+re-parses and re-cascades a stylesheet for each widget subtree it is
+set on, so one shared sheet is polished once and cached, and widgets
+opt in via object names instead of carrying their own CSS copy.
+"""
+
+APP_QSS = """
+QMainWindow {
+    background-color: #f8fafc;  /* Lighter, more modern background */
+}
+QTabWidget::pane {
+    border: none;  /* Remove border for cleaner look */
+    background: white;
+    border-radius: 8px;  /* Slightly larger radius */
+    margin-top: 10px;    /* Add spacing below tabs */
+    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);  /* Subtle shadow for depth */
+}
+QTabBar::tab {
+    background: #f1f5f9;  /* Softer background */
+    color: #64748b;      /* Muted text color */
+    padding: 10px 25px;   /* Larger padding */
+    margin: 0 2px;
+    border-radius: 6px 6px 0 0;  /* Rounded top corners only */
+    border: none;
+    font-weight: 500;    /* Slightly bold text */
+}
+QTabBar::tab:hover {
+    background: #e2e8f0;  /* Subtle hover effect */
+}
+QTabBar::tab:selected {
+    background: #3b82f6;  /* Modern blue */
+    color: white;
+}
+QPushButton {
+    background-color: #3b82f6;  /* Modern blue */
+    color: white;
+    padding: 8px 16px;
+    border: none;
+    border-radius: 6px;
+    font-weight: 500;
+    min-width: 100px;
+}
+QPushButton:hover {
+    background-color: #2563eb;  /* Darker blue on hover */
+}
+QPushButton:pressed {
+    background-color: #1d4ed8;  /* Even darker when pressed */
+}
+QTableWidget {
+    border: 1px solid #e2e8f0;
+    border-radius: 8px;
+    background: white;
+    gridline-color: #f1f5f9;
+}
+QTableWidget::item {
+    padding: 8px;
+    border-bottom: 1px solid #f1f5f9;
+}
+QHeaderView::section {
+    background-color: #f8fafc;
+    padding: 8px;
+    border: none;
+    border-bottom: 2px solid #e2e8f0;
+    font-weight: 600;
+    color: #475569;
+}
+QScrollBar:vertical {
+    border: none;
+    background: #f1f5f9;
+    width: 12px;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical {
+    background: #cbd5e1;
+    border-radius: 6px;
+}
+QScrollBar::handle:vertical:hover {
+    background: #94a3b8;
+}
+
+/* Employees tab action buttons */
+QPushButton#addEmployeeBtn {
+    background-color: #3b82f6;  /* Blue for primary action */
+}
+QPushButton#editEmployeeBtn {
+    background-color: #f59e0b;  /* Amber for modification */
+}
+QPushButton#removeEmployeeBtn {
+    background-color: #ef4444;  /* Red for destructive action */
+}
+
+/* Rules tab list */
+QListWidget#rulesList {
+    background-color: white;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+}
+QListWidget#rulesList::item {
+    padding: 8px;
+    border-bottom: 1px solid #f0f0f0;
+}
+QListWidget#rulesList::item:selected {
+    background-color: #e5edff;
+    color: #2563eb;
+}
+
+/* Employee details dialog */
+QDialog#employeeDialog {
+    background-color: #f5f5f5;
+}
+QDialog#employeeDialog QGroupBox {
+    font-weight: bold;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+    margin-top: 12px;
+    background-color: white;
+}
+QDialog#employeeDialog QGroupBox::title {
+    background-color: transparent;
+    padding: 5px;
+}
+QDialog#employeeDialog QLineEdit {
+    padding: 8px;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+}
+QDialog#employeeDialog QLineEdit:focus {
+    border: 1px solid #2563eb;
+}
+QDialog#employeeDialog QPushButton {
+    padding: 8px 16px;
+    border-radius: 4px;
+}
+QDialog#employeeDialog QPushButton#save_btn {
+    background-color: #2563eb;
+    color: white;
+    border: none;
+}
+QDialog#employeeDialog QPushButton#save_btn:hover {
+    background-color: #1d4ed8;
+}
+QDialog#employeeDialog QPushButton#cancel_btn {
+    background-color: #f3f4f6;
+    border: 1px solid #e0e0e0;
+}
+QDialog#employeeDialog QPushButton#cancel_btn:hover {
+    background-color: #e5e7eb;
+}
+QDialog#employeeDialog QComboBox {
+    padding: 8px;
+    border: 1px solid #e0e0e0;
+    border-radius: 4px;
+}
+QDialog#employeeDialog QComboBox::drop-down {
+    border: none;
+}
+QDialog#employeeDialog QComboBox::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 5px solid #666;
+    margin-right: 8px;
+}
+"""
@@ -1,15 +1,54 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QTableWidget, QTableWidgetItem,
-                            QMessageBox)
-from PyQt6.QtCore import Qt
+                            QPushButton, QTableView, QMessageBox)
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from src.database.manager import DatabaseManager
 
+class EmployeeTableModel(QAbstractTableModel):
+    """
+    Read-only model over the employee row dicts. The view only asks
+    for cells it paints, so no per-cell item objects are allocated and
+    a refresh is one model reset instead of a setItem per cell.
+    """
+
+    # Column order, fixed here instead of trusting each row dict's
+    # insertion order to line up with the headers.
+    COLUMNS = ('name', 'status', 'preferred_shift', 'days_off', 'notes')
+    HEADERS = ("Name", "Status", "Preferred Shift", "Days Off", "Notes")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(self._rows[index.row()][self.COLUMNS[index.column()]])
+        return None
+
+    def headerData(self, section, orientation,
+                   role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal):
+            return self.HEADERS[section]
+        return None
+
+    def set_rows(self, rows):
+        """Swap in a new row list with a single reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
 class EmployeesTab(QWidget):
     """
     Employees tab of the application.
     Manages employee records and their scheduling preferences.
     """
-    
+
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
@@ -36,31 +75,18 @@ class EmployeesTab(QWidget):
         for btn in [self.add_employee_btn, self.edit_employee_btn, self.remove_employee_btn]:
             btn.setCursor(Qt.CursorShape.PointingHandCursor)  # Hand cursor on hover
 
-        # Style specific buttons differently
-        self.add_employee_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3b82f6;  /* Blue for primary action */
-            }
-        """)
-        self.edit_employee_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f59e0b;  /* Amber for modification */
-            }
-        """)
-        self.remove_employee_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ef4444;  /* Red for destructive action */
-            }
-        """)
+        # Per-button colors come from the application stylesheet,
+        # keyed on these object names
+        self.add_employee_btn.setObjectName("addEmployeeBtn")
+        self.edit_employee_btn.setObjectName("editEmployeeBtn")
+        self.remove_employee_btn.setObjectName("removeEmployeeBtn")
                     
         layout.addLayout(button_layout)
                     
         # Create employee table
-        self.employee_table = QTableWidget()
-        self.employee_table.setColumnCount(5)
-        self.employee_table.setHorizontalHeaderLabels([
-            "Name", "Status", "Preferred Shift", "Days Off", "Notes"
-        ])
+        self.employee_model = EmployeeTableModel(self)
+        self.employee_table = QTableView()
+        self.employee_table.setModel(self.employee_model)
                     
         # Set column widths
         self.employee_table.horizontalHeader().setStretchLastSection(True)
@@ -96,12 +122,7 @@ class EmployeesTab(QWidget):
     
     def refresh_table(self):
         """Update the table with current employee data."""
-        self.employee_table.setRowCount(len(self.employees))
-        
-        for row, employee in enumerate(self.employees):
-            for col, (key, value) in enumerate(employee.items()):
-                item = QTableWidgetItem(str(value))
-                self.employee_table.setItem(row, col, item)
+        self.employee_model.set_rows(self.employees)
     
     def add_employee(self):
         """Placeholder for adding an employee."""
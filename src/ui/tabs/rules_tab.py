@@ -45,22 +45,9 @@ class RulesTab(QWidget):
             item = QListWidgetItem(rule)
             self.rules_list.addItem(item)
         
-        # Style the list
-        self.rules_list.setStyleSheet("""
-            QListWidget {
-                background-color: white;
-                border: 1px solid #e0e0e0;
-                border-radius: 4px;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-            QListWidget::item:selected {
-                background-color: #e5edff;
-                color: #2563eb;
-            }
-        """)
+        # List styling comes from the application stylesheet,
+        # keyed on this object name
+        self.rules_list.setObjectName("rulesList")
         
         layout.addWidget(self.rules_list)
         
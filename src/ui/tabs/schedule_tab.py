@@ -1,11 +1,14 @@
+from collections import OrderedDict, defaultdict
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCalendarWidget,
-    QLabel, QTableWidget, QTableWidgetItem, QMessageBox, QMenu,
+    QLabel, QTableView, QHeaderView, QMessageBox, QMenu,
     QDialog, QGridLayout, QCheckBox
 )
-from PyQt6.QtCore import Qt, QDate, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QDate, QModelIndex, QTimer, pyqtSignal
+)
 from PyQt6.QtGui import QColor, QAction
 
 from ...database.manager import DatabaseManager
@@ -14,16 +17,125 @@ from ...models.schedule import (
 )
 from ..dialogs import GenerateScheduleDialog, EditShiftsDialog
 
+# Hoisted out of the render loop: enum iteration, the per-type minimum
+# staffing descriptor, the warning background and the cell flag mask
+# are all invariant, so the per-cell work is plain indexing.
+_SHIFT_TYPES = tuple(ShiftType)
+_SHIFT_TYPE_INDEX = {
+    shift_type: index for index, shift_type in enumerate(_SHIFT_TYPES)
+}
+_MIN_STAFF = tuple(
+    shift_type.min_staff_required for shift_type in _SHIFT_TYPES
+)
+_WARNING_BRUSH = QColor(255, 200, 200)
+_CELL_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+class ScheduleGridModel(QAbstractTableModel):
+    """
+    Read-only model behind the weekly schedule grid. Cells live in a
+    plain dict keyed by (row, col); a refresh swaps the dict and emits
+    one reset instead of allocating a QTableWidgetItem per cell, and
+    the view asks data() only for the cells it actually paints.
+    """
+
+    DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday",
+            "Friday", "Saturday", "Sunday")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (row, col) -> (text, understaffed); absent keys render empty
+        self._cells: Dict[Tuple[int, int], Tuple[str, bool]] = {}
+
+        # Alternating status/staff row labels, one pair per shift type
+        self._row_headers = []
+        for shift_type in _SHIFT_TYPES:
+            self._row_headers.extend([shift_type.value.title(), "Staff"])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._row_headers)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.DAYS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        cell = self._cells.get((index.row(), index.column()))
+        if cell is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return cell[0]
+        if role == Qt.ItemDataRole.BackgroundRole and cell[1]:
+            return _WARNING_BRUSH
+        return None
+
+    def headerData(self, section, orientation,
+                   role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            if orientation == Qt.Orientation.Horizontal:
+                return self.DAYS[section]
+            return self._row_headers[section]
+        return None
+
+    def flags(self, index):
+        return _CELL_FLAGS
+
+    def update_cells(self, cells: Dict[Tuple[int, int], Tuple[str, bool]]) -> None:
+        """
+        Swap in a new cell dict, signalling only the coordinates whose
+        content actually changed. After an edit touching one day/shift
+        the view repaints that slot's two cells rather than all of
+        them; an identical reload signals nothing at all.
+        """
+        old = self._cells
+        changed = [
+            key for key in cells.keys() | old.keys()
+            if cells.get(key) != old.get(key)
+        ]
+        self._cells = cells
+
+        roles = [
+            Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole
+        ]
+        for row, col in changed:
+            index = self.index(row, col)
+            self.dataChanged.emit(index, index, roles)
+
 class ScheduleTab(QWidget):
     """Schedule tab of the application. Displays and manages weekly schedules."""
     
     schedule_updated = pyqtSignal()  # Emitted when schedule changes
     
+    # Delay between the last calendar click and the week load; clicks
+    # landed while browsing don't each cost a query.
+    CLICK_DEBOUNCE_MS = 150
+
+    # Weeks kept in the navigation cache; enough to cover back-and-forth
+    # scrubbing without holding a whole planning horizon in memory.
+    WEEK_CACHE_SIZE = 8
+
     def __init__(self, db_manager: DatabaseManager):
         super().__init__()
         self.db_manager = db_manager
         self.current_week_start: Optional[date] = None
         self.current_schedule: Optional[SchedulePeriod] = None
+
+        # Recently fetched weeks keyed by their Monday, least recently
+        # used first; entries are dropped whenever this tab writes to
+        # the schedule.
+        self._week_cache: OrderedDict[date, Optional[SchedulePeriod]] = (
+            OrderedDict()
+        )
+
+        # Employees seen while rendering, so scrubbing back and forth
+        # through weeks only fetches ids that haven't appeared yet.
+        # Cleared via invalidate_employee_cache when employee records
+        # change.
+        self._employee_cache: Dict[int, object] = {}
+        self._pending_week: Optional[date] = None
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.CLICK_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._apply_pending_week)
+
         self.init_ui()
         
     def init_ui(self) -> None:
@@ -87,7 +199,9 @@ class ScheduleTab(QWidget):
         layout.addLayout(control_bar)
         
         # Create schedule grid
-        self.schedule_grid = QTableWidget()
+        self.schedule_model = ScheduleGridModel(self)
+        self.schedule_grid = QTableView()
+        self.schedule_grid.setModel(self.schedule_model)
         self.schedule_grid.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.schedule_grid.customContextMenuRequested.connect(self._show_context_menu)
         self._initialize_schedule_grid()
@@ -99,52 +213,76 @@ class ScheduleTab(QWidget):
         
     def _initialize_schedule_grid(self) -> None:
         """Set up the schedule display grid."""
-        days = ["Monday", "Tuesday", "Wednesday", "Thursday", 
-                "Friday", "Saturday", "Sunday"]
-        
-        self.schedule_grid.setColumnCount(len(days))
-        self.schedule_grid.setHorizontalHeaderLabels(days)
-        
-        # Three rows for each shift type
-        self.schedule_grid.setRowCount(len(ShiftType) * 2)
-        vertical_headers = []
-        for shift_type in ShiftType:
-            vertical_headers.extend([
-                shift_type.value.title(),
-                "Staff"
-            ])
-        self.schedule_grid.setVerticalHeaderLabels(vertical_headers)
-        
-        # Set column widths
-        for col in range(len(days)):
-            self.schedule_grid.setColumnWidth(col, 150)
+        # Headers and row/column counts come from the model; only the
+        # view geometry is configured here. Columns are a fixed 150px —
+        # with Fixed mode Qt never walks the cells measuring text to
+        # find the widest entry, which it would do per refresh under a
+        # contents-driven mode.
+        horizontal = self.schedule_grid.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        horizontal.setDefaultSectionSize(150)
+
+        # Let the header track content height itself; set once, it
+        # replaces an explicit resizeRowsToContents sweep over every
+        # row on each week change
+        self.schedule_grid.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
             
     def _week_selected(self, selected_date: QDate) -> None:
         """Handle week selection in the calendar."""
         # Convert to Python date and find the Monday of this week
         py_date = selected_date.toPyDate()
         monday = py_date - timedelta(days=py_date.weekday())
-        
-        if monday != self.current_week_start:
-            self.current_week_start = monday
+
+        if monday == self.current_week_start:
+            # Another day inside the loaded week: nothing to load, and
+            # any debounced jump still in flight is superseded
+            self._pending_week = None
+            self._debounce.stop()
+        else:
+            # Debounce: only the last click within the window loads
+            self._pending_week = monday
+            self._debounce.start()
+
+    def _apply_pending_week(self) -> None:
+        """Load the week picked by the most recent calendar click."""
+        if self._pending_week and self._pending_week != self.current_week_start:
+            self.current_week_start = self._pending_week
             self._load_week_schedule()
-            
-    def _load_week_schedule(self) -> None:
-        """Load and display the schedule for the current week."""
+        self._pending_week = None
+
+    def _load_week_schedule(self, refresh: bool = False) -> None:
+        """
+        Load and display the schedule for the current week, from the
+        session cache when it's been fetched before. Pass refresh=True
+        after a write to re-read from the database.
+        """
         if not self.current_week_start:
             return
             
         week_end = self.current_week_start + timedelta(days=6)
         
         try:
-            # Get schedule for this week
-            schedules = self.db_manager.get_schedule_periods(
-                start_date=self.current_week_start,
-                end_date=week_end
-            )
-            
-            if schedules:
-                self.current_schedule = schedules[0]
+            if refresh:
+                self._week_cache.pop(self.current_week_start, None)
+
+            if self.current_week_start in self._week_cache:
+                schedule = self._week_cache[self.current_week_start]
+                self._week_cache.move_to_end(self.current_week_start)
+            else:
+                # One round trip brings back the schedule, its shifts
+                # and the employees they reference
+                schedule, employees = self.db_manager.get_week_view(
+                    self.current_week_start, week_end
+                )
+                self._week_cache[self.current_week_start] = schedule
+                self._employee_cache.update(employees)
+                if len(self._week_cache) > self.WEEK_CACHE_SIZE:
+                    self._week_cache.popitem(last=False)
+
+            if schedule:
+                self.current_schedule = schedule
                 self.status_label.setText(
                     f"Schedule Status: {self.current_schedule.status.value}"
                 )
@@ -171,68 +309,79 @@ class ScheduleTab(QWidget):
             self._clear_schedule_grid()
             return
             
-        # Group shifts by date and type
-        shifts_by_date: Dict[date, Dict[ShiftType, List[str]]] = {}
-        current = self.current_week_start
-        
-        while current <= self.current_week_start + timedelta(days=6):
-            shifts_by_date[current] = {
-                shift_type: [] for shift_type in ShiftType
-            }
-            current += timedelta(days=1)
-            
-        # Populate shift assignments
-        for shift in self.current_schedule.shifts:
-            if shift.date in shifts_by_date:
-                employee = self.db_manager.get_employee(shift.employee_id)
+        schedule = self.current_schedule
+
+        # Fetch every assignee in one batched SELECT instead of one
+        # get_employee round trip per shift assignment; ids already in
+        # the session cache skip the database entirely
+        employee_map = self._employee_cache
+        missing = {
+            shift.employee_id for shift in schedule.shifts
+        } - employee_map.keys()
+        if missing:
+            employee_map.update(
+                (employee.id, employee)
+                for employee in self.db_manager.get_employees_by_ids(missing)
+            )
+
+        # One pass over the shifts buckets names straight to their
+        # (column, shift row) slot; the render loop below only reads
+        monday = self.current_week_start
+        buckets: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for shift in schedule.shifts:
+            col = (shift.date - monday).days
+            if 0 <= col < 7:
+                employee = employee_map.get(shift.employee_id)
                 if employee:
-                    shifts_by_date[shift.date][shift.shift_type].append(
+                    buckets[(col, _SHIFT_TYPE_INDEX[shift.shift_type])].append(
                         employee.full_name
                     )
-                    
-        # Update grid
-        for col, current_date in enumerate(sorted(shifts_by_date.keys())):
-            row = 0
-            for shift_type in ShiftType:
-                # Status cell
-                status_item = QTableWidgetItem("✓")
-                if len(shifts_by_date[current_date][shift_type]) < shift_type.min_staff_required:
-                    status_item = QTableWidgetItem("⚠")
-                    status_item.setBackground(QColor(255, 200, 200))
-                status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.schedule_grid.setItem(row, col, status_item)
-                
-                # Staff list cell
-                staff_text = "\n".join(shifts_by_date[current_date][shift_type])
-                staff_item = QTableWidgetItem(staff_text)
-                staff_item.setFlags(staff_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.schedule_grid.setItem(row + 1, col, staff_item)
-                
-                row += 2
-                
-        self.schedule_grid.resizeRowsToContents()
+
+        cells: Dict[Tuple[int, int], Tuple[str, bool]] = {}
+        for col in range(7):
+            for type_index in range(len(_SHIFT_TYPES)):
+                staff_names = buckets.get((col, type_index), ())
+                understaffed = len(staff_names) < _MIN_STAFF[type_index]
+                row = type_index * 2
+                cells[(row, col)] = (
+                    "⚠" if understaffed else "✓", understaffed
+                )
+                cells[(row + 1, col)] = ("\n".join(staff_names), False)
+
+        self.schedule_model.update_cells(cells)
         
+    def invalidate_employee_cache(self) -> None:
+        """
+        Drop cached employee records so the next grid refresh re-reads
+        them. Call after employee records are added, edited or removed.
+        """
+        self._employee_cache.clear()
+
     def _clear_schedule_grid(self) -> None:
         """Clear all data from the schedule grid."""
-        for row in range(self.schedule_grid.rowCount()):
-            for col in range(self.schedule_grid.columnCount()):
-                self.schedule_grid.setItem(row, col, QTableWidgetItem(""))
+        self.schedule_model.update_cells({})
                 
     def _previous_week(self) -> None:
         """Move to the previous week."""
         if self.current_week_start:
-            new_date = self.current_week_start - timedelta(days=7)
-            self.calendar.setSelectedDate(QDate.fromString(
-                new_date.isoformat(), Qt.DateFormat.ISODate
-            ))
-            
+            self._navigate_to(self.current_week_start - timedelta(days=7))
+
     def _next_week(self) -> None:
         """Move to the next week."""
         if self.current_week_start:
-            new_date = self.current_week_start + timedelta(days=7)
-            self.calendar.setSelectedDate(QDate.fromString(
-                new_date.isoformat(), Qt.DateFormat.ISODate
-            ))
+            self._navigate_to(self.current_week_start + timedelta(days=7))
+
+    def _navigate_to(self, monday: date) -> None:
+        """
+        Jump the calendar to a week and schedule its load through the
+        debouncer, so a held arrow button moves the selection per click
+        but only the week it lands on is fetched and rendered.
+        """
+        self.calendar.setSelectedDate(
+            QDate(monday.year, monday.month, monday.day)
+        )
+        self._pending_week = monday
+        self._debounce.start()
             
     def _generate_schedule(self) -> None:
         """Generate a new schedule for the current week."""
@@ -247,7 +396,7 @@ class ScheduleTab(QWidget):
             )
             
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                self._load_week_schedule()
+                self._load_week_schedule(refresh=True)
                 self.schedule_updated.emit()
                 
         except Exception as e:
@@ -268,7 +417,7 @@ class ScheduleTab(QWidget):
                 ScheduleStatus.PUBLISHED
             )
             
-            self._load_week_schedule()
+            self._load_week_schedule(refresh=True)
             self.schedule_updated.emit()
             
             QMessageBox.information(
@@ -292,14 +441,14 @@ class ScheduleTab(QWidget):
         if self.current_schedule.status != ScheduleStatus.DRAFT:
             return
             
-        item = self.schedule_grid.itemAt(position)
-        if not item:
+        index = self.schedule_grid.indexAt(position)
+        if not index.isValid():
             return
-            
+
         menu = QMenu()
         edit_action = QAction("Edit Shifts", self)
         edit_action.triggered.connect(
-            lambda: self._edit_shifts(item.row(), item.column())
+            lambda: self._edit_shifts(index.row(), index.column())
         )
         menu.addAction(edit_action)
         
@@ -311,7 +460,7 @@ class ScheduleTab(QWidget):
             return
             
         shift_date = self.current_week_start + timedelta(days=col)
-        shift_type = list(ShiftType)[row // 2]  # Integer division
+        shift_type = _SHIFT_TYPES[row // 2]  # Integer division
         
         dialog = EditShiftsDialog(
             self.db_manager,
@@ -319,7 +468,37 @@ class ScheduleTab(QWidget):
             shift_date,
             shift_type
         )
-        
+
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self._load_week_schedule()
-            self.schedule_updated.emit()
\ No newline at end of file
+            self._reload_shift(shift_date, shift_type)
+            self.schedule_updated.emit()
+
+    def _reload_shift(self, shift_date: date, shift_type: ShiftType) -> None:
+        """
+        Refresh a single day/shift slot after an edit. The dialog only
+        writes one slot, so re-reading its employee ids is enough;
+        re-querying the whole week and rebuilding every cell isn't.
+        """
+        schedule = self.current_schedule
+        if not schedule:
+            return
+
+        employee_ids = self.db_manager.get_shift_employee_ids(
+            schedule.id, shift_date, shift_type
+        )
+
+        # Replace the slot's assignments in place; the cached
+        # SchedulePeriod stays current, so the week cache entry does too
+        schedule.shifts = [
+            shift for shift in schedule.shifts
+            if shift.date != shift_date or shift.shift_type != shift_type
+        ] + [
+            ShiftAssignment._from_row(
+                None, employee_id, shift_date, shift_type, schedule.id, None
+            )
+            for employee_id in employee_ids
+        ]
+        schedule.invalidate_shift_index()
+
+        # The model diffs, so only the edited slot's cells repaint
+        self._update_schedule_grid()
\ No newline at end of file